@@ -1,27 +1,68 @@
 ﻿import os
+import re
+import atexit
 import json
 import time
+import random
+import queue
+import threading
+import sqlite3
+import fcntl
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+import base64
+import hashlib
+import hmac
+import unicodedata
+from types import SimpleNamespace
 from datetime import datetime
-import pytz
+from zoneinfo import ZoneInfo
 
 import gspread
-from flask import Flask, render_template_string, request, session
+from flask import Flask, Response, request, session, abort
+from flask_compress import Compress
 import uuid
-from oauth2client.service_account import ServiceAccountCredentials
+from google.oauth2.service_account import Credentials
 
 # 追加 -----------------------------------
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 # ----------------------------------------
 
+# JSON は orjson があればそちらを使う（無ければ標準の json）
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # line-bot-sdk v2 系
 from linebot import LineBotApi, WebhookHandler
 from linebot.exceptions import InvalidSignatureError
+from linebot.http_client import RequestsHttpClient, RequestsHttpResponse
 from linebot.models import (
     MessageEvent, TextMessage, TextSendMessage, FlexSendMessage
 )
 
+if orjson is not None:
+    # LineBotApi は送信ボディを json.dumps で、WebhookParser は受信ボディを json.loads で扱うので、
+    # linebot.api / linebot.webhook の json だけ orjson に差し替える
+    # (bytes のまま requests に渡るので日本語もそのまま UTF-8 で送られる)
+    import linebot.api
+    import linebot.webhook
+    linebot.api.json = linebot.webhook.json = SimpleNamespace(
+        dumps=lambda obj, **kwargs: orjson.dumps(obj),
+        loads=orjson.loads,
+    )
+
 app = Flask(__name__)
 app.secret_key = 'some_secret_key'  # セッションが必要
+# ルートは固定なので末尾スラッシュのリダイレクトはしない
+app.url_map.strict_slashes = False
+
+# レスポンスを gzip 圧縮する ("OK" のような短いレスポンスは圧縮しない)
+app.config["COMPRESS_MIN_SIZE"] = 500
+Compress(app)
 
 # -----------------------
 # 環境変数取得
@@ -30,31 +71,147 @@ LINE_CHANNEL_SECRET = os.environ.get("LINE_CHANNEL_SECRET", "")
 LINE_CHANNEL_ACCESS_TOKEN = os.environ.get("LINE_CHANNEL_ACCESS_TOKEN", "")
 SERVICE_ACCOUNT_FILE = os.environ.get("GCP_SERVICE_ACCOUNT_JSON", "")
 SPREADSHEET_KEY = os.environ.get("SPREADSHEET_KEY", "")
+REDIS_URL = os.environ.get("REDIS_URL", "")
+
+# 日本時間（毎回タイムゾーンを引き直さないよう起動時に一度だけ作る）
+_JST = ZoneInfo("Asia/Tokyo")
+_now_jst_cache = (0, "")
+
+
+def now_jst():
+    """
+    現在の UNIX 秒と、日本時間の文字列 (YYYY/MM/DD HH:MM:SS) を返す。
+    同じ秒の間は整形済みの文字列を使い回す
+    """
+    global _now_jst_cache
+    sec = int(time.time())
+    cached_sec, cached_str = _now_jst_cache
+    if sec != cached_sec:
+        cached_str = datetime.fromtimestamp(sec, _JST).strftime("%Y/%m/%d %H:%M:%S")
+        _now_jst_cache = (sec, cached_str)
+    return sec, cached_str
+
+
+class PooledRequestsHttpClient(RequestsHttpClient):
+    """
+    RequestsHttpClient は呼び出しごとに requests.post などを使うため、毎回 TLS 接続からやり直しになる。
+    1つの requests.Session を使い回して keep-alive で接続を再利用する。
+    """
 
-line_bot_api = LineBotApi(LINE_CHANNEL_ACCESS_TOKEN)
+    def __init__(self, timeout=RequestsHttpClient.DEFAULT_TIMEOUT):
+        super().__init__(timeout=timeout)
+        self.session = requests.Session()
+        # 接続エラー・429/5xx は短いバックオフで2回まで再試行する
+        # (urllib3 の既定で POST は 5xx 再試行の対象外なので reply_message が二重送信されることはない)
+        retry = Retry(total=2, backoff_factor=0.1, status_forcelist=(429, 500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+        self.session.mount("https://", adapter)
+
+    def get(self, url, headers=None, params=None, stream=False, timeout=None):
+        if timeout is None:
+            timeout = self.timeout
+        response = self.session.get(url, headers=headers, params=params, stream=stream, timeout=timeout)
+        return RequestsHttpResponse(response)
+
+    def post(self, url, headers=None, data=None, timeout=None):
+        if timeout is None:
+            timeout = self.timeout
+        response = self.session.post(url, headers=headers, data=data, timeout=timeout)
+        return RequestsHttpResponse(response)
+
+    def put(self, url, headers=None, data=None, timeout=None):
+        if timeout is None:
+            timeout = self.timeout
+        response = self.session.put(url, headers=headers, data=data, timeout=timeout)
+        return RequestsHttpResponse(response)
+
+    def delete(self, url, headers=None, data=None, timeout=None):
+        if timeout is None:
+            timeout = self.timeout
+        response = self.session.delete(url, headers=headers, data=data, timeout=timeout)
+        return RequestsHttpResponse(response)
+
+
+# タイムアウトは (接続, 読み込み) 秒。LINE API の遅延で worker が長く塞がらないようにする
+line_bot_api = LineBotApi(LINE_CHANNEL_ACCESS_TOKEN, timeout=(2, 5), http_client=PooledRequestsHttpClient)
 handler = WebhookHandler(LINE_CHANNEL_SECRET)
 
+# 署名検証用のチャネルシークレット (bytes 化は起動時に一度だけ)
+_LINE_CHANNEL_SECRET_BYTES = LINE_CHANNEL_SECRET.encode("utf-8")
+
 
 # -----------------------
 # Google Sheets 接続
 # -----------------------
+# 認証済みクライアント / スプレッドシート / ワークシートはプロセス内で使い回す
+# (アクセストークンの期限切れは gspread 側で自動的に更新される)
+_gspread_lock = threading.RLock()
+_gspread_client = None
+_spreadsheet = None
+_worksheets = {}  # { title: Worksheet }
+
+
 def get_gspread_client():
     """
     環境変数 SERVICE_ACCOUNT_FILE (JSONパス or JSON文字列) から認証情報を取り出し、
-    gspread クライアントを返す
+    gspread クライアントを返す（2回目以降はキャッシュ済みのクライアント）
     """
-    if not SERVICE_ACCOUNT_FILE:
-        raise ValueError("環境変数 GCP_SERVICE_ACCOUNT_JSON が設定されていません。")
+    global _gspread_client
+    if _gspread_client is not None:
+        return _gspread_client
 
-    service_account_dict = json.loads(SERVICE_ACCOUNT_FILE)
+    with _gspread_lock:
+        if _gspread_client is not None:
+            return _gspread_client
 
-    scope = [
-        "https://spreadsheets.google.com/feeds",
-        "https://www.googleapis.com/auth/spreadsheets",
-        "https://www.googleapis.com/auth/drive",
-    ]
-    credentials = ServiceAccountCredentials.from_json_keyfile_dict(service_account_dict, scope)
-    return gspread.authorize(credentials)
+        if not SERVICE_ACCOUNT_FILE:
+            raise ValueError("環境変数 GCP_SERVICE_ACCOUNT_JSON が設定されていません。")
+
+        if orjson is not None:
+            service_account_dict = orjson.loads(SERVICE_ACCOUNT_FILE)
+        else:
+            service_account_dict = json.loads(SERVICE_ACCOUNT_FILE)
+
+        scope = [
+            "https://spreadsheets.google.com/feeds",
+            "https://www.googleapis.com/auth/spreadsheets",
+            "https://www.googleapis.com/auth/drive",
+        ]
+        credentials = Credentials.from_service_account_info(service_account_dict, scopes=scope)
+        # google-auth の認証情報を渡すと gspread 内部で AuthorizedSession (requests.Session) が作られ、
+        # クライアントをキャッシュしている間は sheets.googleapis.com への接続が keep-alive で使い回される
+        _gspread_client = gspread.authorize(credentials)
+        return _gspread_client
+
+
+def get_spreadsheet():
+    """
+    SPREADSHEET_KEY のスプレッドシートを返す（初回のみ open_by_key する）
+    """
+    global _spreadsheet
+    if _spreadsheet is not None:
+        return _spreadsheet
+
+    with _gspread_lock:
+        if _spreadsheet is None:
+            _spreadsheet = get_gspread_client().open_by_key(SPREADSHEET_KEY)
+        return _spreadsheet
+
+
+def get_worksheet(title):
+    """
+    title のワークシートを返す（初回のみ取得・作成する）
+    """
+    ws = _worksheets.get(title)
+    if ws is not None:
+        return ws
+
+    with _gspread_lock:
+        ws = _worksheets.get(title)
+        if ws is None:
+            ws = get_or_create_worksheet(get_spreadsheet(), title)
+            _worksheets[title] = ws
+        return ws
 
 
 def get_or_create_worksheet(sheet, title):
@@ -79,20 +236,134 @@ def get_or_create_worksheet(sheet, title):
     return ws
 
 
-def write_to_spreadsheet_for_catalog(form_data: dict):
-    gc = get_gspread_client()
-    sh = gc.open_by_key(SPREADSHEET_KEY)
-    worksheet = get_or_create_worksheet(sh, "CatalogRequests")
+# Sheets API の一時的なエラー (レート制限・サーバーエラー) は待ってから再試行する
+SHEETS_RETRY_STATUSES = frozenset({429, 500, 503})
 
-    # --- 重複チェック (メールアドレス) ---
-    email_list = worksheet.col_values(6) 
+
+def call_with_sheets_retry(func, *args, attempts=5, max_wait=16.0, **kwargs):
+    """
+    func を呼び出し、Sheets API が 429/500/503 を返した場合は指数バックオフ + ジッターで再試行する
+    """
+    for attempt in range(attempts):
+        try:
+            return func(*args, **kwargs)
+        except gspread.exceptions.APIError as e:
+            status = getattr(getattr(e, "response", None), "status_code", None)
+            if status not in SHEETS_RETRY_STATUSES or attempt == attempts - 1:
+                raise
+            time.sleep(min(max_wait, 2 ** attempt) + random.uniform(0, 1))
+
+
+def _warm_up_worksheets():
+    """
+    認証とワークシート取得を起動直後に済ませ、最初のリクエストで待たせないようにする
+    """
+    try:
+        for title in ("CatalogRequests", "簡易見積"):
+            get_worksheet(title)
+    except Exception as e:
+        print(f"ワークシートの事前取得に失敗: {e}")
+
+
+if SERVICE_ACCOUNT_FILE and SPREADSHEET_KEY:
+    threading.Thread(target=_warm_up_worksheets, daemon=True).start()
+
+
+# カタログ申込みはまずローカルの SQLite に保存し (リクエストはここで完了)、
+# バックグラウンドのスレッドが未同期の行をまとめて CatalogRequests に append_rows する。
+# シートへの書き込みに失敗した行は synced=0 のまま残り、次の周期で再送される。
+# メールアドレスの重複チェックも SQLite だけで行う (シートの既存アドレスは同期のたびに catalog_sheet_emails へ取り込む)
+CATALOG_DB_PATH = os.getenv("CATALOG_DB_PATH", "catalog_forms.db")
+CATALOG_BATCH_SIZE = 500       # 1回の append_rows で書き込む最大行数
+CATALOG_FLUSH_INTERVAL = 30    # 同期する間隔 (秒)
+# gunicorn の複数 worker のうち同期するのは1つだけにするためのロックファイル
+CATALOG_FLUSH_LOCK_FILE = CATALOG_DB_PATH + ".lock"
+
+_catalog_db = sqlite3.connect(CATALOG_DB_PATH, isolation_level=None, check_same_thread=False)
+_catalog_db.execute("PRAGMA journal_mode=WAL")
+_catalog_db.execute(
+    "CREATE TABLE IF NOT EXISTS catalog_forms ("
+    "id INTEGER PRIMARY KEY, email TEXT, data TEXT, synced INTEGER DEFAULT 0)"
+)
+_catalog_db.execute("CREATE INDEX IF NOT EXISTS catalog_forms_email ON catalog_forms (email)")
+_catalog_db.execute("CREATE TABLE IF NOT EXISTS catalog_sheet_emails (email TEXT PRIMARY KEY)")
+_catalog_db_lock = threading.Lock()
+
+
+def _sync_catalog_rows():
+    """
+    未同期の行を CatalogRequests に書き込み、書き込めた行を synced=1 にする
+    """
+    with _catalog_db_lock:
+        pending = _catalog_db.execute(
+            "SELECT id, data FROM catalog_forms WHERE synced = 0 ORDER BY id LIMIT ?",
+            (CATALOG_BATCH_SIZE,),
+        ).fetchall()
+    if not pending:
+        return
+
+    rows = [orjson.loads(data) if orjson is not None else json.loads(data) for _, data in pending]
+    # USER_ENTERED で書き込み、日時 (A列) はこれまで通り日付として解釈させる。
+    # 入力値は先頭に ' を付けて文字列のまま書き込む (電話番号・郵便番号の先頭 0 が消えず、"=" で始まる入力も数式にならない)
+    rows = [[row[0]] + [f"'{value}" if value else value for value in row[1:]] for row in rows]
+    call_with_sheets_retry(
+        get_worksheet("CatalogRequests").append_rows,
+        rows,
+        value_input_option="USER_ENTERED",
+        insert_data_option="INSERT_ROWS",
+        table_range="A1",
+    )
+    with _catalog_db_lock:
+        _catalog_db.executemany(
+            "UPDATE catalog_forms SET synced = 1 WHERE id = ?", [(row_id,) for row_id, _ in pending]
+        )
+
+
+def _load_sheet_emails():
+    """
+    CatalogRequests のメールアドレス列を読み、重複チェック用に catalog_sheet_emails へ取り込む
+    """
+    emails = call_with_sheets_retry(get_worksheet("CatalogRequests").col_values, 6)
+    with _catalog_db_lock:
+        _catalog_db.execute("BEGIN")
+        try:
+            _catalog_db.executemany(
+                "INSERT OR IGNORE INTO catalog_sheet_emails (email) VALUES (?)",
+                [(email.strip(),) for email in emails if email.strip()],
+            )
+        except Exception:
+            _catalog_db.execute("ROLLBACK")
+            raise
+        _catalog_db.execute("COMMIT")
+
+
+def _flush_catalog_rows():
+    """
+    起動直後と CATALOG_FLUSH_INTERVAL ごとに、未同期の行をシートへ書き込み、シートのメールアドレスを取り込む
+    """
+    while True:
+        try:
+            with open(CATALOG_FLUSH_LOCK_FILE, "w") as lock_fp:
+                try:
+                    fcntl.flock(lock_fp, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    pass  # 他の worker が同期中
+                else:
+                    _sync_catalog_rows()
+                    _load_sheet_emails()
+        except Exception as e:
+            print(f"CatalogRequests との同期失敗: {e}")
+        time.sleep(CATALOG_FLUSH_INTERVAL)
+
+
+threading.Thread(target=_flush_catalog_rows, daemon=True).start()
+
+
+def write_to_spreadsheet_for_catalog(form_data: dict):
     new_email = form_data.get("email", "").strip()
-    if new_email in email_list:
-        raise ValueError("ALREADY_REGISTERED")
 
     # 日本時間の現在時刻
-    jst = pytz.timezone('Asia/Tokyo')
-    now_jst_str = datetime.now(jst).strftime("%Y/%m/%d %H:%M:%S")
+    _, now_jst_str = now_jst()
     full_address = f"{form_data.get('address_1', '')} {form_data.get('address_2', '')}".strip()
 
     new_row = [
@@ -107,13 +378,26 @@ def write_to_spreadsheet_for_catalog(form_data: dict):
         form_data.get("usage_purpose", ""),  # 使用用途を追加
         form_data.get("other", ""),
     ]
-    worksheet.append_row(new_row, value_input_option="USER_ENTERED")
+    data = orjson.dumps(new_row) if orjson is not None else json.dumps(new_row, ensure_ascii=False)
+
+    # --- 重複チェック (メールアドレス) ---
+    # 受付済みの申込み・シートの既存アドレスのどちらにも無い場合だけ INSERT する。
+    # 1文の INSERT なので、複数 worker から同時に送信されても二重に登録されない
+    with _catalog_db_lock:
+        cursor = _catalog_db.execute(
+            "INSERT INTO catalog_forms (email, data) SELECT ?, ? "
+            "WHERE NOT EXISTS (SELECT 1 FROM catalog_forms WHERE email = ?) "
+            "AND NOT EXISTS (SELECT 1 FROM catalog_sheet_emails WHERE email = ?)",
+            (new_email, data, new_email, new_email),
+        )
+    if cursor.rowcount == 0:
+        raise ValueError("ALREADY_REGISTERED")
 
 # -----------------------
 # 簡易見積用データ構造
 # -----------------------
 # 変更点はあるがインポートはそのまま
-from PRICE_TABLE_2025 import PRICE_TABLE, COLOR_COST_MAP
+from PRICE_TABLE_2025 import PRICE_TABLE, COLOR_COST_MAP, FULLCOLOR_ADD, SET_NAME_NUM, BIG_NAME, BIG_NUM
 
 # ▼▼▼ 新規: プリント位置が「前のみ/背中のみ」のときの色数選択肢および対応コスト
 COLOR_COST_MAP_SINGLE = {
@@ -131,75 +415,263 @@ COLOR_COST_MAP_BOTH = {
     "前と背中 フルカラー": (0, 2),
 }
 
+# 枚数選択肢を実数化
+QUANTITY_MAP = {
+    "20～29枚": 20,
+    "30～39枚": 30,
+    "40～49枚": 40,
+    "50～99枚": 50,
+    "100枚以上": 100
+}
+
+# 各ステップの選択肢（Flex のボタンと入力チェックで共用）
+USER_TYPES = ("学生", "一般")
+USAGE_DATES = ("14日目以降", "14日目以内")
+BUDGETS = ("特になし", "1,000円以内", "1,500円以内", "2,000円以内", "2,500円以内", "3,000円以内", "3,500円以内")
+ITEMS = (
+    "ゲームシャツ",
+    "ストライプドライベースボールシャツ",
+    "ドライベースボールシャツ",
+    "ストライプユニフォーム",
+    "バスケシャツ",
+    "ドライTシャツ",
+    "ハイクオリティTシャツ",
+    "ドライポロシャツ",
+    "ドライロングスリーブTシャツ",  # 修正
+    "クルーネックライトトレーナー",
+    "ジップアップライトパーカー",
+    "フーデッドライトパーカー",
+)
+QUANTITIES = tuple(QUANTITY_MAP)
+PRINT_POSITIONS = ("前のみ", "背中のみ", "前と背中")
+BACK_NAMES = ("ネーム&背番号セット", "ネーム(大)", "番号(大)", "背ネーム・番号を使わない")
+
+# 入力チェック用（毎回リストを作らず、ハッシュで判定する）
+_VALID_USER_TYPES = frozenset(USER_TYPES)
+_VALID_USAGE_DATES = frozenset(USAGE_DATES)
+_VALID_BUDGETS = frozenset(BUDGETS)
+_VALID_ITEMS = frozenset(ITEMS)
+_VALID_QUANTITIES = frozenset(QUANTITIES)
+_VALID_POSITIONS = frozenset(PRINT_POSITIONS)
+_SINGLE_POSITIONS = frozenset(("前のみ", "背中のみ"))
+_VALID_BACK_NAMES = frozenset(BACK_NAMES)
+
+@dataclass(slots=True)
+class EstimateSession:
+    """
+    見積フロー1件分の状態（現在の step と各ステップの回答）
+    """
+    step: int = 1
+    is_single: bool = False  # 前のみ/背中のみかどうか
+    user_type: str = ""
+    usage_date: str = ""
+    discount_type: str = ""
+    budget: str = ""
+    item: str = ""
+    quantity: str = ""
+    print_position: str = ""
+    color_count: str = ""
+    back_name: str = ""
+
+
 # ユーザの見積フロー管理用（簡易的セッション）
-user_estimate_sessions = {}  # { user_id: {"step": n, "answers": {...}, "is_single": bool} }
+# REDIS_URL が設定されていれば Redis に保存し、複数ワーカー間でセッションを共有する。
+# 未設定の場合はプロセス内の dict に保存する（ローカル確認用・1 ワーカー用。こちらも SESSION_TTL で期限切れにする）
+user_estimate_sessions = {}  # { user_id: (期限 (time.monotonic), EstimateSession) }
+SESSION_TTL = 1800  # 秒。放置された見積りフローは30分で破棄
+SESSION_SWEEP_SIZE = 1024  # プロセス内 dict がこの件数を超えたら期限切れのセッションを掃除する
+
+if REDIS_URL:
+    import redis
+    _redis = redis.Redis.from_url(REDIS_URL)
+else:
+    _redis = None
+    # プロセス内の dict はワーカー間で共有されないので、gunicorn で複数ワーカーを起動した場合は止める
+    if "gunicorn" in os.environ.get("SERVER_SOFTWARE", "") and int(os.environ.get("WEB_CONCURRENCY", "1")) > 1:
+        raise RuntimeError(
+            "REDIS_URL が未設定のまま複数ワーカーで起動しています。"
+            "REDIS_URL を設定するか WEB_CONCURRENCY=1 にしてください。"
+        )
 
 
-def write_estimate_to_spreadsheet(user_id, estimate_data, total_price, unit_price):
+def load_estimate_session(user_id):
+    """
+    見積フローのセッションを取得する。存在しない場合は None
+    """
+    if _redis is None:
+        entry = user_estimate_sessions.get(user_id)
+        if entry is None:
+            return None
+        expires_at, session_data = entry
+        if expires_at < time.monotonic():
+            user_estimate_sessions.pop(user_id, None)
+            return None
+        return session_data
+
+    raw = _redis.get(f"sess:{user_id}")
+    if raw is None:
+        return None
+    return EstimateSession(**(orjson.loads(raw) if orjson is not None else json.loads(raw)))
+
+
+def save_estimate_session(user_id, session_data):
+    """
+    見積フローのセッションを保存する
+    """
+    if _redis is None:
+        now = time.monotonic()
+        if len(user_estimate_sessions) >= SESSION_SWEEP_SIZE:
+            expired = [uid for uid, (expires_at, _) in user_estimate_sessions.items() if expires_at < now]
+            for uid in expired:
+                user_estimate_sessions.pop(uid, None)
+        user_estimate_sessions[user_id] = (now + SESSION_TTL, session_data)
+        return
+
+    raw = orjson.dumps(session_data) if orjson is not None else json.dumps(asdict(session_data))
+    _redis.setex(f"sess:{user_id}", SESSION_TTL, raw)
+
+
+def delete_estimate_session(user_id):
+    """
+    見積フローのセッションを破棄する
+    """
+    if _redis is None:
+        user_estimate_sessions.pop(user_id, None)
+        return
+
+    _redis.delete(f"sess:{user_id}")
+
+
+# 見積り結果の行はキューに積み、バックグラウンドのスレッドがまとめて「簡易見積」に書き込む
+# (LINE への返信を Sheets の応答待ちで遅らせない)
+ESTIMATE_BATCH_SIZE = 50     # 1回の append_rows で書き込む最大行数
+ESTIMATE_FLUSH_WAIT = 2.0    # 最初の行を受け取ってから書き込むまでに待つ最大秒数
+_estimate_rows = queue.Queue(maxsize=1000)
+
+
+def _append_estimate_rows(rows):
+    # values.append に A1 起点の表と INSERT_ROWS を指定し、Sheets 側で末尾に行を挿入させる
+    call_with_sheets_retry(
+        get_worksheet("簡易見積").append_rows,
+        rows,
+        value_input_option="USER_ENTERED",
+        insert_data_option="INSERT_ROWS",
+        table_range="A1",
+    )
+
+
+def _flush_estimate_rows():
     """
-    計算が終わった見積情報をスプレッドシートの「簡易見積」に書き込む
+    _estimate_rows に積まれた行を「簡易見積」にまとめて書き込み続ける
     """
-    gc = get_gspread_client()
-    sh = gc.open_by_key(SPREADSHEET_KEY)
-    worksheet = get_or_create_worksheet(sh, "簡易見積")
+    while True:
+        rows = [_estimate_rows.get()]
+        # 行が少しずつ届き続けても書き込みが遅れ続けないよう、待つのは最初の行から ESTIMATE_FLUSH_WAIT 秒まで
+        deadline = time.monotonic() + ESTIMATE_FLUSH_WAIT
+        while len(rows) < ESTIMATE_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                rows.append(_estimate_rows.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        try:
+            _append_estimate_rows(rows)
+        except Exception as e:
+            print(f"簡易見積 への書き込み失敗 ({len(rows)}件): {e}")
+
+
+def _drain_estimate_rows():
+    """
+    プロセス終了時、キューに残っている行をまとめて書き込む
+    """
+    rows = []
+    while True:
+        try:
+            rows.append(_estimate_rows.get_nowait())
+        except queue.Empty:
+            break
+    if rows:
+        try:
+            _append_estimate_rows(rows)
+        except Exception as e:
+            print(f"簡易見積 への書き込み失敗 ({len(rows)}件): {e}")
+
 
-    quote_number = str(int(time.time()))  # 見積番号を UNIX時間 で仮生成
+threading.Thread(target=_flush_estimate_rows, daemon=True).start()
+atexit.register(_drain_estimate_rows)
 
+
+def write_estimate_to_spreadsheet(user_id, estimate_data, total_price, unit_price):
+    """
+    計算が終わった見積情報をスプレッドシートの「簡易見積」への書き込みキューに積み、見積番号を返す
+    """
     # 日本時間の現在時刻
-    jst = pytz.timezone('Asia/Tokyo')
-    now_jst_str = datetime.now(jst).strftime("%Y/%m/%d %H:%M:%S")
+    now_sec, now_jst_str = now_jst()
+    quote_number = str(now_sec)  # 見積番号を UNIX時間 で仮生成
 
     new_row = [
         now_jst_str,
         quote_number,
         user_id,
-        estimate_data['user_type'],  # 追加した「属性」
-        f"{estimate_data['usage_date']}({estimate_data['discount_type']})",
-        estimate_data['budget'],
-        estimate_data['item'],
-        estimate_data['quantity'],
-        estimate_data['print_position'],
-        estimate_data['color_count'],
-        estimate_data['back_name'],
+        estimate_data.user_type,  # 追加した「属性」
+        f"{estimate_data.usage_date}({estimate_data.discount_type})",
+        estimate_data.budget,
+        estimate_data.item,
+        estimate_data.quantity,
+        estimate_data.print_position,
+        estimate_data.color_count,
+        estimate_data.back_name,
         f"¥{total_price:,}",
         f"¥{unit_price:,}"
     ]
-    worksheet.append_row(new_row, value_input_option="USER_ENTERED")
+    try:
+        _estimate_rows.put_nowait(new_row)
+    except queue.Full:
+        # 書き込みが大きく滞っている (Sheets が応答しない) 場合、ここで書き込んで再試行を待つと
+        # LINE への返信が止まるので、行はログに残して破棄する
+        print(f"簡易見積 の書き込みキューが満杯のため破棄: {new_row}")
 
     return quote_number
 
 
+# (商品名, 割引区分, 枚数) -> PRICE_TABLE の行
+# 枚数は選択肢の実数値のみなので、起動時に全組み合わせを引けるようにしておく
+_PRICE_INDEX = {}
+for _row in PRICE_TABLE:
+    for _qty in QUANTITY_MAP.values():
+        if _row["min_qty"] <= _qty <= _row["max_qty"]:
+            _PRICE_INDEX.setdefault((_row["item"], _row["discount_type"], _qty), _row)
+
+
 def find_price_row(item_name, discount_type, quantity):
     """
     PRICE_TABLE から該当する行を探し返す。該当しない場合は None
     """
-    for row in PRICE_TABLE:
-        if (row["item"] == item_name
-            and row["discount_type"] == discount_type
-            and row["min_qty"] <= quantity <= row["max_qty"]):
-            return row
-    return None
+    return _PRICE_INDEX.get((item_name, discount_type, quantity))
+
+
+# 背ネーム・番号の選択肢 -> 1枚あたりの追加料金
+_BACK_NAME_FEES = {
+    "ネーム&背番号セット": SET_NAME_NUM,
+    "ネーム(大)": BIG_NAME,
+    "番号(大)": BIG_NUM,
+}
 
 
 def calculate_estimate(estimate_data):
     """
     入力された見積データから合計金額と単価を計算して返す
     """
-    item_name = estimate_data['item']
-    discount_type = estimate_data['discount_type']
-    # 枚数選択肢を実数化
-    quantity_map = {
-        "20～29枚": 20,
-        "30～39枚": 30,
-        "40～49枚": 40,
-        "50～99枚": 50,
-        "100枚以上": 100
-    }
-    quantity = quantity_map.get(estimate_data['quantity'], 1)
+    item_name = estimate_data.item
+    discount_type = estimate_data.discount_type
+    quantity = QUANTITY_MAP.get(estimate_data.quantity, 1)
 
-    print_position = estimate_data['print_position']
-    color_choice = estimate_data['color_count']
-    back_name = estimate_data.get('back_name', "")  # 存在しない場合は空文字
+    print_position = estimate_data.print_position
+    color_choice = estimate_data.color_count
+    back_name = estimate_data.back_name
 
     row = find_price_row(item_name, discount_type, quantity)
     if row is None:
@@ -208,29 +680,22 @@ def calculate_estimate(estimate_data):
     base_price = row["unit_price"]
 
     # プリント位置追加
-    if print_position in ["前のみ", "背中のみ"]:
+    if print_position in _SINGLE_POSITIONS:
         pos_add = 0
     else:
         pos_add = row["pos_add"]
 
     # ▼▼▼ 変更点: プリント位置によって color_cost_map を切り替え
-    if print_position in ["前のみ", "背中のみ"]:
+    if print_position in _SINGLE_POSITIONS:
         color_add_count, fullcolor_add_count = COLOR_COST_MAP_SINGLE[color_choice]
         # 背ネームはスキップ扱い => 0円
         back_name_fee = 0
     else:
         color_add_count, fullcolor_add_count = COLOR_COST_MAP_BOTH[color_choice]
-        # 背ネームありの場合を計算
-        if back_name == "ネーム&背番号セット":
-            back_name_fee = row["set_name_num"]
-        elif back_name == "ネーム(大)":
-            back_name_fee = row["big_name"]
-        elif back_name == "番号(大)":
-            back_name_fee = row["big_num"]
-        else:
-            back_name_fee = 0
+        # 背ネームありの場合を計算 (「なし」などは 0円)
+        back_name_fee = _BACK_NAME_FEES.get(back_name, 0)
 
-    color_fee = color_add_count * row["color_add"] + fullcolor_add_count * row["fullcolor_add"]
+    color_fee = color_add_count * row["color_add"] + fullcolor_add_count * FULLCOLOR_ADD
 
     unit_price = base_price + pos_add + color_fee + back_name_fee
     total_price = unit_price * quantity
@@ -238,65 +703,117 @@ def calculate_estimate(estimate_data):
     return total_price, unit_price
 
 
+def _estimate_key(estimate_data):
+    return (
+        estimate_data.item,
+        estimate_data.discount_type,
+        estimate_data.quantity,
+        estimate_data.print_position,
+        estimate_data.color_count,
+        estimate_data.back_name,
+    )
+
+
+# 選択肢の組み合わせは有限なので、全パターンの (合計金額, 単価) を起動時に計算しておく
+# 前のみ/背中のみ の場合、背ネームは「なし」で保存される
+_ESTIMATE_TABLE = {}
+for _item in ITEMS:
+    for _discount_type in ("早割", "通常"):
+        for _quantity in QUANTITIES:
+            for _position in PRINT_POSITIONS:
+                if _position in _SINGLE_POSITIONS:
+                    _colors, _back_names = COLOR_COST_MAP_SINGLE, ("なし",)
+                else:
+                    _colors, _back_names = COLOR_COST_MAP_BOTH, BACK_NAMES
+                for _color in _colors:
+                    for _back_name in _back_names:
+                        _data = EstimateSession(
+                            item=_item,
+                            discount_type=_discount_type,
+                            quantity=_quantity,
+                            print_position=_position,
+                            color_count=_color,
+                            back_name=_back_name,
+                        )
+                        _ESTIMATE_TABLE[_estimate_key(_data)] = calculate_estimate(_data)
+
+
+def get_estimate(estimate_data):
+    """
+    事前計算済みの表から (合計金額, 単価) を返す。表に無い組み合わせはその場で計算する
+    """
+    result = _ESTIMATE_TABLE.get(_estimate_key(estimate_data))
+    if result is None:
+        result = calculate_estimate(estimate_data)
+    return result
+
+
 # -----------------------
 # ここからFlex Message定義
 # -----------------------
-def flex_user_type():
+def _choice_button(label):
     """
-    ❶属性 (学生 or 一般)
+    選択肢ボタン (押すとラベルと同じテキストを送信する)
     """
-    flex_body = {
+    return {
+        "type": "button",
+        "style": "primary",
+        "color": "#fc9cc2",
+        "height": "sm",
+        "action": {
+            "type": "message",
+            "label": label,
+            "text": label
+        }
+    }
+
+
+def _choice_bubble(title, descriptions, labels, footer_flex=None):
+    """
+    見出し・説明文・選択肢ボタンからなる bubble を組み立てる
+    """
+    hero_contents = [
+        {
+            "type": "text",
+            "text": title,
+            "weight": "bold",
+            "size": "lg",
+            "align": "center"
+        }
+    ]
+    for description in descriptions:
+        hero_contents.append({
+            "type": "text",
+            "text": description,
+            "size": "sm",
+            "wrap": True
+        })
+
+    footer = {
+        "type": "box",
+        "layout": "vertical",
+        "spacing": "sm",
+        "contents": [_choice_button(label) for label in labels]
+    }
+    if footer_flex is not None:
+        footer["flex"] = footer_flex
+
+    return {
         "type": "bubble",
         "hero": {
             "type": "box",
             "layout": "vertical",
-            "contents": [
-                {
-                    "type": "text",
-                    "text": "❶属性",
-                    "weight": "bold",
-                    "size": "lg",
-                    "align": "center"
-                },
-                {
-                    "type": "text",
-                    "text": "ご利用者の属性を選択してください。",
-                    "size": "sm",
-                    "wrap": True
-                }
-            ]
+            "contents": hero_contents
         },
-        "footer": {
-            "type": "box",
-            "layout": "vertical",
-            "spacing": "sm",
-            "contents": [
-                {
-                    "type": "button",
-                    "style": "primary",
-                    "color": "#fc9cc2",
-                    "height": "sm",
-                    "action": {
-                        "type": "message",
-                        "label": "学生",
-                        "text": "学生"
-                    }
-                },
-                {
-                    "type": "button",
-                    "style": "primary",
-                    "color": "#fc9cc2",
-                    "height": "sm",
-                    "action": {
-                        "type": "message",
-                        "label": "一般",
-                        "text": "一般"
-                    }
-                }
-            ],
-            "flex": 0
-        }
+        "footer": footer
     }
+
+
+def flex_user_type():
+    """
+    ❶属性 (学生 or 一般)
+    """
+    flex_body = _choice_bubble("❶属性", ["ご利用者の属性を選択してください。"], USER_TYPES, footer_flex=0)
     return FlexSendMessage(alt_text="属性を選択してください", contents=flex_body)
 
 
@@ -304,58 +821,12 @@ def flex_usage_date():
     """
     ❷使用日 (14日目以降 or 14日目以内)
     """
-    flex_body = {
-        "type": "bubble",
-        "hero": {
-            "type": "box",
-            "layout": "vertical",
-            "contents": [
-                {
-                    "type": "text",
-                    "text": "❷使用日",
-                    "weight": "bold",
-                    "size": "lg",
-                    "align": "center"
-                },
-                {
-                    "type": "text",
-                    "text": "ご使用日は、今日より? \n(注文日より使用日が14日目以降なら早割)",
-                    "size": "sm",
-                    "wrap": True
-                }
-            ]
-        },
-        "footer": {
-            "type": "box",
-            "layout": "vertical",
-            "spacing": "sm",
-            "contents": [
-                {
-                    "type": "button",
-                    "style": "primary",
-                    "color": "#fc9cc2",
-                    "height": "sm",
-                    "action": {
-                        "type": "message",
-                        "label": "14日目以降",
-                        "text": "14日目以降"
-                    }
-                },
-                {
-                    "type": "button",
-                    "style": "primary",
-                    "color": "#fc9cc2",
-                    "height": "sm",
-                    "action": {
-                        "type": "message",
-                        "label": "14日目以内",
-                        "text": "14日目以内"
-                    }
-                }
-            ],
-            "flex": 0
-        }
-    }
+    flex_body = _choice_bubble(
+        "❷使用日",
+        ["ご使用日は、今日より? \n(注文日より使用日が14日目以降なら早割)"],
+        USAGE_DATES,
+        footer_flex=0,
+    )
     return FlexSendMessage(alt_text="使用日を選択してください", contents=flex_body)
 
 
@@ -363,118 +834,19 @@ def flex_budget():
     """
     ❸1枚当たりの予算
     """
-    budgets = ["特になし", "1,000円以内", "1,500円以内", "2,000円以内", "2,500円以内", "3,000円以内", "3,500円以内"]
-    buttons = []
-    for b in budgets:
-        buttons.append({
-            "type": "button",
-            "style": "primary",
-            "color": "#fc9cc2",
-            "height": "sm",
-            "action": {
-                "type": "message",
-                "label": b,
-                "text": b
-            }
-        })
-
-    flex_body = {
-        "type": "bubble",
-        "hero": {
-            "type": "box",
-            "layout": "vertical",
-            "contents": [
-                {
-                    "type": "text",
-                    "text": "❸1枚当たりの予算",
-                    "weight": "bold",
-                    "size": "lg",
-                    "align": "center"
-                },
-                {
-                    "type": "text",
-                    "text": "ご希望の1枚あたり予算を選択してください。",
-                    "size": "sm",
-                    "wrap": True
-                }
-            ]
-        },
-        "footer": {
-            "type": "box",
-            "layout": "vertical",
-            "spacing": "sm",
-            "contents": buttons,
-            "flex": 0
-        }
-    }
+    flex_body = _choice_bubble("❸1枚当たりの予算", ["ご希望の1枚あたり予算を選択してください。"], BUDGETS, footer_flex=0)
     return FlexSendMessage(alt_text="予算を選択してください", contents=flex_body)
 
 
 def flex_item_select():
     """
-    ❹商品名
-    """
-    items = [
-        "ゲームシャツ",
-        "ストライプドライベースボールシャツ",
-        "ドライベースボールシャツ",
-        "ストライプユニフォーム",
-        "バスケシャツ",
-        "ドライTシャツ",
-        "ハイクオリティTシャツ",
-        "ドライポロシャツ",
-        "ドライロングスリーブTシャツ",  # 修正
-        "クルーネックライトトレーナー",
-        "ジップアップライトパーカー",
-        "フーデッドライトパーカー",
-    ]
-
-    item_bubbles = []
+    ❹商品名 (5件ずつの bubble を並べたカルーセル)
+    """
     chunk_size = 5
-    for i in range(0, len(items), chunk_size):
-        chunk_part = items[i:i + chunk_size]
-        buttons = []
-        for it in chunk_part:
-            buttons.append({
-                "type": "button",
-                "style": "primary",
-                "color": "#fc9cc2",
-                "height": "sm",
-                "action": {
-                    "type": "message",
-                    "label": it,
-                    "text": it
-                }
-            })
-        bubble = {
-            "type": "bubble",
-            "hero": {
-                "type": "box",
-                "layout": "vertical",
-                "contents": [
-                    {
-                        "type": "text",
-                        "text": "❹商品名",
-                        "weight": "bold",
-                        "size": "lg",
-                        "align": "center"
-                    },
-                    {
-                        "type": "text",
-                        "text": "ご希望の商品を選択してください。",
-                        "size": "sm",
-                        "wrap": True
-                    }
-                ]
-            },
-            "footer": {
-                "type": "box",
-                "layout": "vertical",
-                "spacing": "sm",
-                "contents": buttons
-            }
-        }
-        item_bubbles.append(bubble)
+    item_bubbles = [
+        _choice_bubble("❹商品名", ["ご希望の商品を選択してください。"], ITEMS[i:i + chunk_size])
+        for i in range(0, len(ITEMS), chunk_size)
+    ]
 
     carousel = {
         "type": "carousel",
@@ -487,49 +859,7 @@ def flex_quantity():
     """
     ❺枚数
     """
-    quantities = ["20～29枚", "30～39枚", "40～49枚", "50～99枚", "100枚以上"]
-    buttons = []
-    for q in quantities:
-        buttons.append({
-            "type": "button",
-            "style": "primary",
-            "color": "#fc9cc2",
-            "height": "sm",
-            "action": {
-                "type": "message",
-                "label": q,
-                "text": q
-            }
-        })
-
-    flex_body = {
-        "type": "bubble",
-        "hero": {
-            "type": "box",
-            "layout": "vertical",
-            "contents": [
-                {
-                    "type": "text",
-                    "text": "❺枚数",
-                    "weight": "bold",
-                    "size": "lg",
-                    "align": "center"
-                },
-                {
-                    "type": "text",
-                    "text": "必要枚数を選択してください。",
-                    "size": "sm",
-                    "wrap": True
-                },
-            ]
-        },
-        "footer": {
-            "type": "box",
-            "layout": "vertical",
-            "spacing": "sm",
-            "contents": buttons
-        }
-    }
+    flex_body = _choice_bubble("❺枚数", ["必要枚数を選択してください。"], QUANTITIES)
     return FlexSendMessage(alt_text="必要枚数を選択してください", contents=flex_body)
 
 
@@ -537,49 +867,7 @@ def flex_print_position():
     """
     ❻プリント位置
     """
-    positions = ["前のみ", "背中のみ", "前と背中"]
-    buttons = []
-    for pos in positions:
-        buttons.append({
-            "type": "button",
-            "style": "primary",
-            "color": "#fc9cc2",
-            "height": "sm",
-            "action": {
-                "type": "message",
-                "label": pos,
-                "text": pos
-            }
-        })
-
-    flex_body = {
-        "type": "bubble",
-        "hero": {
-            "type": "box",
-            "layout": "vertical",
-            "contents": [
-                {
-                    "type": "text",
-                    "text": "❻プリント位置",
-                    "weight": "bold",
-                    "size": "lg",
-                    "align": "center"
-                },
-                {
-                    "type": "text",
-                    "text": "プリントを入れる箇所を選択してください。",
-                    "size": "sm",
-                    "wrap": True
-                }
-            ]
-        },
-        "footer": {
-            "type": "box",
-            "layout": "vertical",
-            "spacing": "sm",
-            "contents": buttons
-        }
-    }
+    flex_body = _choice_bubble("❻プリント位置", ["プリントを入れる箇所を選択してください。"], PRINT_POSITIONS)
     return FlexSendMessage(alt_text="プリント位置を選択してください", contents=flex_body)
 
 
@@ -588,49 +876,11 @@ def flex_color_count_single():
     """
     ❼色数（シングル: 前のみ / 背中のみ）
     """
-    color_choices = list(COLOR_COST_MAP_SINGLE.keys())
-    buttons_bubbles = []
-    for c in color_choices:
-        buttons_bubbles.append({
-            "type": "button",
-            "style": "primary",
-            "color": "#fc9cc2",
-            "height": "sm",
-            "action": {
-                "type": "message",
-                "label": c,
-                "text": c
-            }
-        })
-
-    flex_body = {
-        "type": "bubble",
-        "hero": {
-            "type": "box",
-            "layout": "vertical",
-            "contents": [
-                {
-                    "type": "text",
-                    "text": "❼色数",
-                    "weight": "bold",
-                    "size": "lg",
-                    "align": "center"
-                },
-                {
-                    "type": "text",
-                    "text": "プリントの色数を選択してください。\n（前のみ/背中のみ）",
-                    "size": "sm",
-                    "wrap": True
-                }
-            ]
-        },
-        "footer": {
-            "type": "box",
-            "layout": "vertical",
-            "spacing": "sm",
-            "contents": buttons_bubbles
-        }
-    }
+    flex_body = _choice_bubble(
+        "❼色数",
+        ["プリントの色数を選択してください。\n（前のみ/背中のみ）"],
+        COLOR_COST_MAP_SINGLE,
+    )
     return FlexSendMessage(alt_text="色数を選択してください", contents=flex_body)
 
 
@@ -639,49 +889,11 @@ def flex_color_count_both():
     """
     ❼色数（両面: 前と背中）
     """
-    color_choices = list(COLOR_COST_MAP_BOTH.keys())
-    buttons_bubbles = []
-    for c in color_choices:
-        buttons_bubbles.append({
-            "type": "button",
-            "style": "primary",
-            "color": "#fc9cc2",
-            "height": "sm",
-            "action": {
-                "type": "message",
-                "label": c,
-                "text": c
-            }
-        })
-
-    flex_body = {
-        "type": "bubble",
-        "hero": {
-            "type": "box",
-            "layout": "vertical",
-            "contents": [
-                {
-                    "type": "text",
-                    "text": "❼色数",
-                    "weight": "bold",
-                    "size": "lg",
-                    "align": "center"
-                },
-                {
-                    "type": "text",
-                    "text": "プリントの色数を選択してください。\n（前と背中）",
-                    "size": "sm",
-                    "wrap": True
-                }
-            ]
-        },
-        "footer": {
-            "type": "box",
-            "layout": "vertical",
-            "spacing": "sm",
-            "contents": buttons_bubbles
-        }
-    }
+    flex_body = _choice_bubble(
+        "❼色数",
+        ["プリントの色数を選択してください。\n（前と背中）"],
+        COLOR_COST_MAP_BOTH,
+    )
     return FlexSendMessage(alt_text="色数を選択してください", contents=flex_body)
 
 
@@ -689,55 +901,14 @@ def flex_back_name():
     """
     ❽背ネーム・番号
     """
-    names = ["ネーム&背番号セット", "ネーム(大)", "番号(大)", "背ネーム・番号を使わない"]
-    buttons = []
-    for nm in names:
-        buttons.append({
-            "type": "button",
-            "style": "primary",
-            "color": "#fc9cc2",
-            "height": "sm",
-            "action": {
-                "type": "message",
-                "label": nm,
-                "text": nm
-            }
-        })
-
-    flex_body = {
-        "type": "bubble",
-        "hero": {
-            "type": "box",
-            "layout": "vertical",
-            "contents": [
-                {
-                    "type": "text",
-                    "text": "❽背ネーム・番号",
-                    "weight": "bold",
-                    "size": "lg",
-                    "align": "center"
-                },
-                {
-                    "type": "text",
-                    "text": "背ネームや番号を入れる場合は選択してください。",
-                    "size": "sm",
-                    "wrap": True
-                },
-                {
-                    "type": "text",
-                    "text": "不要な場合は「背ネーム・番号を使わない」を選択してください。",
-                    "size": "sm",
-                    "wrap": True
-                }
-            ]
-        },
-        "footer": {
-            "type": "box",
-            "layout": "vertical",
-            "spacing": "sm",
-            "contents": buttons
-        }
-    }
+    flex_body = _choice_bubble(
+        "❽背ネーム・番号",
+        [
+            "背ネームや番号を入れる場合は選択してください。",
+            "不要な場合は「背ネーム・番号を使わない」を選択してください。",
+        ],
+        BACK_NAMES,
+    )
     return FlexSendMessage(alt_text="背ネーム・番号を選択してください", contents=flex_body)
 
 
@@ -784,14 +955,103 @@ def flex_inquiry():
     return FlexSendMessage(alt_text="お問い合わせ情報", contents=contents)
 
 
+# -----------------------
+# 固定の返信メッセージ (起動時に一度だけ作って使い回す)
+# -----------------------
+class PrebuiltMessage:
+    """
+    as_json_dict() の結果を起動時に一度だけ作っておく送信メッセージ。
+    reply_message は送信のたびにモデルを辿って dict 化するので、固定の返信はこれで包んで省く
+    """
+
+    __slots__ = ("_json_dict",)
+
+    def __init__(self, message):
+        self._json_dict = message.as_json_dict()
+
+    def as_json_dict(self):
+        return self._json_dict
+
+
+# 見積りフローの選択肢 Flex は内容が固定なので、毎回組み立てずに同じオブジェクトを返信する
+_FLEX_USER_TYPE = PrebuiltMessage(flex_user_type())
+_FLEX_USAGE_DATE = PrebuiltMessage(flex_usage_date())
+_FLEX_BUDGET = PrebuiltMessage(flex_budget())
+_FLEX_ITEM_SELECT = PrebuiltMessage(flex_item_select())
+_FLEX_QUANTITY = PrebuiltMessage(flex_quantity())
+_FLEX_PRINT_POSITION = PrebuiltMessage(flex_print_position())
+_FLEX_COLOR_COUNT_SINGLE = PrebuiltMessage(flex_color_count_single())
+_FLEX_COLOR_COUNT_BOTH = PrebuiltMessage(flex_color_count_both())
+_FLEX_BACK_NAME = PrebuiltMessage(flex_back_name())
+
+_HUMAN_CHAT_REPLY = PrebuiltMessage(TextSendMessage(text=(
+    "有人チャットに接続いたします。\n"
+    "担当スタッフが順番に対応いたします。\n"
+    "お繋ぎしている間、下記の情報をお知らせください✨\n\n"
+    "①ご使用日：\n"
+    "②ご購入枚数(ざっくりでOK)：\n"
+    "③ご予算(1枚あたり)：\n"
+    "④デザイン(スクショでOK)：\n\n"
+    "その他のご質問もお気軽にご相談ください！"
+)))
+
+_CATALOG_INFO_REPLY = PrebuiltMessage(TextSendMessage(text=(
+    "🎁➖➖➖➖➖➖➖➖🎁\n"
+    "  ✨カタログ無料プレゼント✨\n"
+    "🎁➖➖➖➖➖➖➖➖🎁\n\n"
+    "クラスTシャツの最新デザインやトレンド情報が詰まったカタログを、"
+    "期間限定で無料でお届けします✨\n\n"
+    "【応募方法】\n"
+    "以下のアカウントをフォロー👇\n"
+    "（どちらかでOK🙆）\n"
+    "📸 Instagram\n"
+    "https://www.instagram.com/graffitees_045/\n"
+    "🎥 TikTok\n"
+    "https://www.tiktok.com/@graffitees_045\n\n"
+    "フォロー後、下記のフォームからお申込みください👇\n"
+    "📩 カタログ申込みフォーム\n"
+    "https://catalog-bot-1.onrender.com/catalog_form\n"
+    "⚠️ 注意：サブアカウントや重複申込みはご遠慮ください。\n"
+    "⚠️ 注意：住所や氏名等に不備がある場合はお届けができません。\n\n"
+    "【カタログ発送時期】\n"
+    "📅 2026年4月中旬より郵送で発送予定です。\n\n"
+    "【配布数について】\n"
+    "先着300名様分を予定しています。\n"
+    "※応募多数となった場合、配布数の増加や抽選となる可能性があります。\n\n"
+    "ご応募お待ちしております🙆"
+)))
+
+_FLOW_ERROR_REPLY = PrebuiltMessage(TextSendMessage(text="エラーが発生しました。見積りフローを終了しました。最初からやり直してください。"))
+
+# 完全一致で返信が決まるメッセージ
+_EXACT_REPLIES = {
+    "お問い合わせ": PrebuiltMessage(flex_inquiry()),
+    "#有人チャット": _HUMAN_CHAT_REPLY,
+}
+
+# カタログ案内のトリガー ("キャンペーン" or "catalog" を含む場合。catalog は大文字小文字を区別しない)
+_CATALOG_RE = re.compile(r"キャンペーン|catalog", re.IGNORECASE)
+
+
 # -----------------------
 # 1) LINE Messaging API 受信 (Webhook)
 # -----------------------
-@app.route("/line/callback", methods=["POST"])
+@app.route("/line/callback", methods=["POST"], provide_automatic_options=False)
 def line_callback():
-    signature = request.headers["X-Line-Signature"]
-    body = request.get_data(as_text=True)
+    # 署名ヘッダの無いリクエスト (ヘルスチェックやスキャナ) は KeyError の 500 にせずすぐ 400 を返す
+    signature = request.headers.get("X-Line-Signature")
+    if not signature:
+        return "Missing signature.", 400
+    body_bytes = request.get_data()
+    if not body_bytes:
+        return "OK", 200
+
+    # 署名が合わないリクエストは JSON を解析する前にここで弾く
+    digest = hmac.new(_LINE_CHANNEL_SECRET_BYTES, body_bytes, hashlib.sha256).digest()
+    if not hmac.compare_digest(base64.b64encode(digest), signature.encode("utf-8")):
+        abort(400, "Invalid signature. Please check your channel access token/channel secret.")
 
+    body = body_bytes.decode("utf-8")
     try:
         handler.handle(body, signature)
     except InvalidSignatureError:
@@ -808,35 +1068,16 @@ def handle_message(event: MessageEvent):
     user_id = event.source.user_id
     user_message = event.message.text.strip()
 
-    # 1) お問い合わせ対応
-    if user_message == "お問い合わせ":
-        line_bot_api.reply_message(
-            event.reply_token,
-            flex_inquiry()
-        )
-        return
-
-    # 2) 有人チャット
-    if user_message == "#有人チャット":
-        reply_text = (
-            "有人チャットに接続いたします。\n"
-            "担当スタッフが順番に対応いたします。\n"
-            "お繋ぎしている間、下記の情報をお知らせください✨\n\n"
-            "①ご使用日：\n"
-            "②ご購入枚数(ざっくりでOK)：\n"
-            "③ご予算(1枚あたり)：\n"
-            "④デザイン(スクショでOK)：\n\n"
-            "その他のご質問もお気軽にご相談ください！"
-        )
-        line_bot_api.reply_message(
-            event.reply_token,
-            TextSendMessage(text=reply_text)
-        )
+    # 1) お問い合わせ対応 / 2) 有人チャット
+    reply = _EXACT_REPLIES.get(user_message)
+    if reply is not None:
+        line_bot_api.reply_message(event.reply_token, reply)
         return
 
     # すでに見積りフロー中かどうか
-    if user_id in user_estimate_sessions and user_estimate_sessions[user_id]["step"] > 0:
-        process_estimate_flow(event, user_message)
+    session_data = load_estimate_session(user_id)
+    if session_data is not None and session_data.step > 0:
+        process_estimate_flow(event, user_message, session_data)
         return
 
     # 見積りフロー開始
@@ -845,7 +1086,7 @@ def handle_message(event: MessageEvent):
         return
 
     # カタログ案内 (トリガー例: "キャンペーン" or "catalog" など含む場合)
-    if "キャンペーン" in user_message or "catalog" in user_message.lower():
+    if _CATALOG_RE.search(user_message):
         send_catalog_info(event)
         return
 
@@ -854,32 +1095,7 @@ def handle_message(event: MessageEvent):
 
 
 def send_catalog_info(event: MessageEvent):
-    reply_text = (
-        "🎁➖➖➖➖➖➖➖➖🎁\n"
-        "  ✨カタログ無料プレゼント✨\n"
-        "🎁➖➖➖➖➖➖➖➖🎁\n\n"
-        "クラスTシャツの最新デザインやトレンド情報が詰まったカタログを、"
-        "期間限定で無料でお届けします✨\n\n"
-        "【応募方法】\n"
-        "以下のアカウントをフォロー👇\n"
-        "（どちらかでOK🙆）\n"
-        "📸 Instagram\n"
-        "https://www.instagram.com/graffitees_045/\n"
-        "🎥 TikTok\n"
-        "https://www.tiktok.com/@graffitees_045\n\n"
-        "フォロー後、下記のフォームからお申込みください👇\n"
-        "📩 カタログ申込みフォーム\n"
-        "https://catalog-bot-1.onrender.com/catalog_form\n"
-        "⚠️ 注意：サブアカウントや重複申込みはご遠慮ください。\n"
-        "⚠️ 注意：住所や氏名等に不備がある場合はお届けができません。\n\n"
-        "【カタログ発送時期】\n"
-        "📅 2026年4月中旬より郵送で発送予定です。\n\n"
-        "【配布数について】\n"
-        "先着300名様分を予定しています。\n"
-        "※応募多数となった場合、配布数の増加や抽選となる可能性があります。\n\n"
-        "ご応募お待ちしております🙆"
-    )
-    line_bot_api.reply_message(event.reply_token, TextSendMessage(text=reply_text))
+    line_bot_api.reply_message(event.reply_token, _CATALOG_INFO_REPLY)
 
 # -----------------------
 # 見積りフロー
@@ -891,353 +1107,356 @@ def start_estimate_flow(event: MessageEvent):
     user_id = event.source.user_id
 
     # セッションを初期化
-    user_estimate_sessions[user_id] = {
-        "step": 1,
-        "answers": {},
-        "is_single": False  # 新規: 前のみ/背中のみかどうか
-    }
+    save_estimate_session(user_id, EstimateSession(step=1))
 
     # 最初のステップ（属性選択Flex）を送る
     line_bot_api.reply_message(
         event.reply_token,
-        flex_user_type()
+        _FLEX_USER_TYPE
     )
 
 
-def process_estimate_flow(event: MessageEvent, user_message: str):
+# 見積り完了時の返信文 (前のみ/背中のみ の場合、背ネーム・番号は「なし」)
+_ESTIMATE_REPLY_TEMPLATE = (
+    "概算のお見積りが完了しました。\n\n"
+    "見積番号: {quote_number}\n"
+    "属性: {user_type}\n"
+    "使用日: {usage_date}（{discount_type}）\n"
+    "予算: {budget}\n"
+    "商品: {item}\n"
+    "枚数: {quantity}\n"
+    "プリント位置: {print_position}\n"
+    "色数: {color_count}\n"
+    "背ネーム・番号: {back_name}\n\n"
+    "【合計金額】¥{total_price:,}\n"
+    "【1枚あたり】¥{unit_price:,}\n"
+)
+
+
+def estimate_reply(session_data: EstimateSession, quote_number, total_price, unit_price):
     """
-    見積フロー中のやり取り
-    step 1: 属性
-    step 2: 使用日
-    step 3: 予算
-    step 4: 商品名
-    step 5: 枚数
-    step 6: プリント位置
-    step 7: 色数
-       - (前のみ/背中のみ)の場合 -> フロー完了へ
-       - (前と背中)の場合 -> step 8: 背ネーム・番号 -> step 9: 完了
+    見積り結果の返信メッセージを作る
+    """
+    return TextSendMessage(text=_ESTIMATE_REPLY_TEMPLATE.format(
+        quote_number=quote_number,
+        user_type=session_data.user_type,
+        usage_date=session_data.usage_date,
+        discount_type=session_data.discount_type,
+        budget=session_data.budget,
+        item=session_data.item,
+        quantity=session_data.quantity,
+        print_position=session_data.print_position,
+        color_count=session_data.color_count,
+        back_name=session_data.back_name,
+        total_price=total_price,
+        unit_price=unit_price,
+    ))
+
+
+_INVALID_REPLY = PrebuiltMessage(TextSendMessage(text="入力内容に誤りがあるようです。 \nお手数をおかけしますが、再度メニューの「カンタン見積り」より、該当の項目を選択タブからお選びください。\n※テキストの直接入力はご利用いただけませんので、ご了承くださいませ。"))
+
+
+def _abort_flow(event: MessageEvent, user_id):
     """
+    不正入力時: セッションを破棄して、メニューからやり直すよう案内する
+    """
+    delete_estimate_session(user_id)
+    line_bot_api.reply_message(event.reply_token, _INVALID_REPLY)
+
+
+# 1) 属性
+def _step_user_type(event: MessageEvent, user_message: str, session_data: EstimateSession):
     user_id = event.source.user_id
-    if user_id not in user_estimate_sessions:
-        return
+    if user_message in _VALID_USER_TYPES:
+        session_data.user_type = user_message
+        session_data.step = 2
+        save_estimate_session(user_id, session_data)
+        line_bot_api.reply_message(event.reply_token, _FLEX_USAGE_DATE)
+    else:
+        _abort_flow(event, user_id)
 
-    session_data = user_estimate_sessions[user_id]
-    step = session_data["step"]
 
-    # 1) 属性
-    if step == 1:
-        if user_message in ["学生", "一般"]:
-            session_data["answers"]["user_type"] = user_message
-            session_data["step"] = 2
-            line_bot_api.reply_message(event.reply_token, flex_usage_date())
-        else:
-            del user_estimate_sessions[user_id]
-            line_bot_api.reply_message(
-                event.reply_token,
-                TextSendMessage(text="入力内容に誤りがあるようです。 \nお手数をおかけしますが、再度メニューの「カンタン見積り」より、該当の項目を選択タブからお選びください。\n※テキストの直接入力はご利用いただけませんので、ご了承くださいませ。")
-            )
-        return
+# 2) 使用日
+def _step_usage_date(event: MessageEvent, user_message: str, session_data: EstimateSession):
+    user_id = event.source.user_id
+    if user_message in _VALID_USAGE_DATES:
+        session_data.usage_date = user_message
+        session_data.discount_type = "早割" if user_message == "14日目以降" else "通常"
+        session_data.step = 3
+        save_estimate_session(user_id, session_data)
+        line_bot_api.reply_message(event.reply_token, _FLEX_BUDGET)
+    else:
+        _abort_flow(event, user_id)
 
-    # 2) 使用日
-    elif step == 2:
-        if user_message in ["14日目以降", "14日目以内"]:
-            session_data["answers"]["usage_date"] = user_message
-            session_data["answers"]["discount_type"] = "早割" if user_message == "14日目以降" else "通常"
-            session_data["step"] = 3
-            line_bot_api.reply_message(event.reply_token, flex_budget())
-        else:
-            del user_estimate_sessions[user_id]
-            line_bot_api.reply_message(
-                event.reply_token,
-                TextSendMessage(text="入力内容に誤りがあるようです。 \nお手数をおかけしますが、再度メニューの「カンタン見積り」より、該当の項目を選択タブからお選びください。\n※テキストの直接入力はご利用いただけませんので、ご了承くださいませ。")
-            )
-        return
 
-    # 3) 1枚当たりの予算
-    elif step == 3:
-        valid_budgets = ["特になし", "1,000円以内", "1,500円以内", "2,000円以内", "2,500円以内", "3,000円以内", "3,500円以内"]
-        if user_message in valid_budgets:
-            session_data["answers"]["budget"] = user_message
-            session_data["step"] = 4
-            line_bot_api.reply_message(event.reply_token, flex_item_select())
-        else:
-            del user_estimate_sessions[user_id]
-            line_bot_api.reply_message(
-                event.reply_token,
-                TextSendMessage(text="入力内容に誤りがあるようです。 \nお手数をおかけしますが、再度メニューの「カンタン見積り」より、該当の項目を選択タブからお選びください。\n※テキストの直接入力はご利用いただけませんので、ご了承くださいませ。")
-            )
-        return
+# 3) 1枚当たりの予算
+def _step_budget(event: MessageEvent, user_message: str, session_data: EstimateSession):
+    user_id = event.source.user_id
+    if user_message in _VALID_BUDGETS:
+        session_data.budget = user_message
+        session_data.step = 4
+        save_estimate_session(user_id, session_data)
+        line_bot_api.reply_message(event.reply_token, _FLEX_ITEM_SELECT)
+    else:
+        _abort_flow(event, user_id)
 
-    # 4) 商品名
-    elif step == 4:
-        items = [
-            "ゲームシャツ",
-            "ストライプドライベースボールシャツ",
-            "ドライベースボールシャツ",
-            "ストライプユニフォーム",
-            "バスケシャツ",
-            "ドライTシャツ",
-            "ハイクオリティTシャツ",
-            "ドライポロシャツ",
-            "ドライロングスリーブTシャツ",
-            "クルーネックライトトレーナー",
-            "ジップアップライトパーカー",
-            "フーデッドライトパーカー",
-        ]
-        if user_message in items:
-            session_data["answers"]["item"] = user_message
-            session_data["step"] = 5
-            line_bot_api.reply_message(event.reply_token, flex_quantity())
-        else:
-            del user_estimate_sessions[user_id]
-            line_bot_api.reply_message(
-                event.reply_token,
-                TextSendMessage(text="入力内容に誤りがあるようです。 \nお手数をおかけしますが、再度メニューの「カンタン見積り」より、該当の項目を選択タブからお選びください。\n※テキストの直接入力はご利用いただけませんので、ご了承くださいませ。")
-            )
-        return
 
-    # 5) 枚数
-    elif step == 5:
-        valid_choices = ["20～29枚", "30～39枚", "40～49枚", "50～99枚", "100枚以上"]
-        if user_message in valid_choices:
-            session_data["answers"]["quantity"] = user_message
-            session_data["step"] = 6
-            line_bot_api.reply_message(event.reply_token, flex_print_position())
-        else:
-            del user_estimate_sessions[user_id]
-            line_bot_api.reply_message(
-                event.reply_token,
-                TextSendMessage(text="入力内容に誤りがあるようです。 \nお手数をおかけしますが、再度メニューの「カンタン見積り」より、該当の項目を選択タブからお選びください。\n※テキストの直接入力はご利用いただけませんので、ご了承くださいませ。")
-            )
-        return
+# 4) 商品名
+def _step_item(event: MessageEvent, user_message: str, session_data: EstimateSession):
+    user_id = event.source.user_id
+    if user_message in _VALID_ITEMS:
+        session_data.item = user_message
+        session_data.step = 5
+        save_estimate_session(user_id, session_data)
+        line_bot_api.reply_message(event.reply_token, _FLEX_QUANTITY)
+    else:
+        _abort_flow(event, user_id)
 
-    # 6) プリント位置
-    elif step == 6:
-        valid_positions = ["前のみ", "背中のみ", "前と背中"]
-        if user_message in valid_positions:
-            session_data["answers"]["print_position"] = user_message
-            session_data["step"] = 7
-
-            # 新規: プリント位置が 前のみ/背中のみ なら is_single=True
-            if user_message in ["前のみ", "背中のみ"]:
-                session_data["is_single"] = True
-                line_bot_api.reply_message(event.reply_token, flex_color_count_single())
-            else:
-                session_data["is_single"] = False
-                line_bot_api.reply_message(event.reply_token, flex_color_count_both())
-        else:
-            del user_estimate_sessions[user_id]
-            line_bot_api.reply_message(
-                event.reply_token,
-                TextSendMessage(text="入力内容に誤りがあるようです。 \nお手数をおかけしますが、再度メニューの「カンタン見積り」より、該当の項目を選択タブからお選びください。\n※テキストの直接入力はご利用いただけませんので、ご了承くださいませ。")
-            )
-        return
 
-    # 7) 色数
-    elif step == 7:
-        # プリント位置が「前のみ/背中のみ」→ is_single=True
-        #           が「前と背中」 → is_single=False
-        if session_data["is_single"]:
-            # シングル面の色数マップをチェック
-            if user_message not in COLOR_COST_MAP_SINGLE:
-                # 不正入力
-                del user_estimate_sessions[user_id]
-                line_bot_api.reply_message(
-                    event.reply_token,
-                    TextSendMessage(text="入力内容に誤りがあるようです。 \nお手数をおかけしますが、再度メニューの「カンタン見積り」より、該当の項目を選択タブからお選びください。\n※テキストの直接入力はご利用いただけませんので、ご了承くださいませ。")
-                )
-                return
-
-            # OK
-            session_data["answers"]["color_count"] = user_message
-            # 背ネーム・番号はスキップ => back_name=空 or "なし" として保存
-            session_data["answers"]["back_name"] = "なし"
-
-            # 計算
-            est_data = session_data["answers"]
-            total_price, unit_price = calculate_estimate(est_data)
-            quote_number = write_estimate_to_spreadsheet(user_id, est_data, total_price, unit_price)
-
-            reply_text = (
-                f"概算のお見積りが完了しました。\n\n"
-                f"見積番号: {quote_number}\n"
-                f"属性: {est_data['user_type']}\n"
-                f"使用日: {est_data['usage_date']}（{est_data['discount_type']}）\n"
-                f"予算: {est_data['budget']}\n"
-                f"商品: {est_data['item']}\n"
-                f"枚数: {est_data['quantity']}\n"
-                f"プリント位置: {est_data['print_position']}\n"
-                f"色数: {est_data['color_count']}\n"
-                f"背ネーム・番号: なし\n\n"
-                f"【合計金額】¥{total_price:,}\n"
-                f"【1枚あたり】¥{unit_price:,}\n"
-            )
-            line_bot_api.reply_message(
-                event.reply_token,
-                TextSendMessage(text=reply_text)
-            )
+# 5) 枚数
+def _step_quantity(event: MessageEvent, user_message: str, session_data: EstimateSession):
+    user_id = event.source.user_id
+    if user_message in _VALID_QUANTITIES:
+        session_data.quantity = user_message
+        session_data.step = 6
+        save_estimate_session(user_id, session_data)
+        line_bot_api.reply_message(event.reply_token, _FLEX_PRINT_POSITION)
+    else:
+        _abort_flow(event, user_id)
 
-            # フロー終了
-            del user_estimate_sessions[user_id]
 
+# 6) プリント位置
+def _step_print_position(event: MessageEvent, user_message: str, session_data: EstimateSession):
+    user_id = event.source.user_id
+    if user_message in _VALID_POSITIONS:
+        session_data.print_position = user_message
+        session_data.step = 7
+
+        # 新規: プリント位置が 前のみ/背中のみ なら is_single=True
+        session_data.is_single = user_message in _SINGLE_POSITIONS
+        save_estimate_session(user_id, session_data)
+        if session_data.is_single:
+            line_bot_api.reply_message(event.reply_token, _FLEX_COLOR_COUNT_SINGLE)
         else:
-            # 前と背中 の場合
-            if user_message not in COLOR_COST_MAP_BOTH:
-                # 不正入力
-                del user_estimate_sessions[user_id]
-                line_bot_api.reply_message(
-                    event.reply_token,
-                    TextSendMessage(text="入力内容に誤りがあるようです。 \nお手数をおかけしますが、再度メニューの「カンタン見積り」より、該当の項目を選択タブからお選びください。\n※テキストの直接入力はご利用いただけませんので、ご了承くださいませ。")
-                )
-                return
-
-            # OK
-            session_data["answers"]["color_count"] = user_message
-            # 次のstep(8)で背ネーム・番号を聞く
-            session_data["step"] = 8
-            line_bot_api.reply_message(event.reply_token, flex_back_name())
+            line_bot_api.reply_message(event.reply_token, _FLEX_COLOR_COUNT_BOTH)
+    else:
+        _abort_flow(event, user_id)
 
-        return
 
-    # 8) 背ネーム・番号 (「前と背中」だけがここへ進む)
-    elif step == 8:
-        valid_back_names = ["ネーム&背番号セット", "ネーム(大)", "番号(大)", "背ネーム・番号を使わない"]
-        if user_message in valid_back_names:
-            session_data["answers"]["back_name"] = user_message
-            session_data["step"] = 9
-
-            # 見積計算
-            est_data = session_data["answers"]
-            total_price, unit_price = calculate_estimate(est_data)
-            quote_number = write_estimate_to_spreadsheet(user_id, est_data, total_price, unit_price)
-
-            reply_text = (
-                f"概算のお見積りが完了しました。\n\n"
-                f"見積番号: {quote_number}\n"
-                f"属性: {est_data['user_type']}\n"
-                f"使用日: {est_data['usage_date']}（{est_data['discount_type']}）\n"
-                f"予算: {est_data['budget']}\n"
-                f"商品: {est_data['item']}\n"
-                f"枚数: {est_data['quantity']}\n"
-                f"プリント位置: {est_data['print_position']}\n"
-                f"色数: {est_data['color_count']}\n"
-                f"背ネーム・番号: {est_data['back_name']}\n\n"
-                f"【合計金額】¥{total_price:,}\n"
-                f"【1枚あたり】¥{unit_price:,}\n"
-            )
-            line_bot_api.reply_message(
-                event.reply_token,
-                TextSendMessage(text=reply_text)
-            )
+# 7) 色数
+def _step_color_count(event: MessageEvent, user_message: str, session_data: EstimateSession):
+    user_id = event.source.user_id
+    # プリント位置が「前のみ/背中のみ」→ is_single=True
+    #           が「前と背中」 → is_single=False
+    if session_data.is_single:
+        # シングル面の色数マップをチェック
+        if user_message not in COLOR_COST_MAP_SINGLE:
+            # 不正入力
+            _abort_flow(event, user_id)
+            return
+
+        # OK
+        session_data.color_count = user_message
+        # 背ネーム・番号はスキップ => back_name=空 or "なし" として保存
+        session_data.back_name = "なし"
+
+        # 計算
+        total_price, unit_price = get_estimate(session_data)
+        quote_number = write_estimate_to_spreadsheet(user_id, session_data, total_price, unit_price)
 
-            # フロー終了
-            del user_estimate_sessions[user_id]
-        else:
-            del user_estimate_sessions[user_id]
-            line_bot_api.reply_message(
-                event.reply_token,
-                TextSendMessage(text="入力内容に誤りがあるようです。 \nお手数をおかけしますが、再度メニューの「カンタン見積り」より、該当の項目を選択タブからお選びください。\n※テキストの直接入力はご利用いただけませんので、ご了承くださいませ。")
-            )
-        return
+        line_bot_api.reply_message(
+            event.reply_token,
+            estimate_reply(session_data, quote_number, total_price, unit_price)
+        )
+
+        # フロー終了
+        delete_estimate_session(user_id)
 
     else:
-        # 何らかの想定外のエラー
-        del user_estimate_sessions[user_id]
+        # 前と背中 の場合
+        if user_message not in COLOR_COST_MAP_BOTH:
+            # 不正入力
+            _abort_flow(event, user_id)
+            return
+
+        # OK
+        session_data.color_count = user_message
+        # 次のstep(8)で背ネーム・番号を聞く
+        session_data.step = 8
+        save_estimate_session(user_id, session_data)
+        line_bot_api.reply_message(event.reply_token, _FLEX_BACK_NAME)
+
+
+# 8) 背ネーム・番号 (「前と背中」だけがここへ進む)
+def _step_back_name(event: MessageEvent, user_message: str, session_data: EstimateSession):
+    user_id = event.source.user_id
+    if user_message in _VALID_BACK_NAMES:
+        session_data.back_name = user_message
+        session_data.step = 9
+
+        # 見積計算
+        total_price, unit_price = get_estimate(session_data)
+        quote_number = write_estimate_to_spreadsheet(user_id, session_data, total_price, unit_price)
+
         line_bot_api.reply_message(
             event.reply_token,
-            TextSendMessage(text="エラーが発生しました。見積りフローを終了しました。最初からやり直してください。")
+            estimate_reply(session_data, quote_number, total_price, unit_price)
         )
+
+        # フロー終了
+        delete_estimate_session(user_id)
+    else:
+        _abort_flow(event, user_id)
+
+
+# step 番号 -> 処理関数 (index 0 は未使用)
+_STEP_HANDLERS = (
+    None,
+    _step_user_type,
+    _step_usage_date,
+    _step_budget,
+    _step_item,
+    _step_quantity,
+    _step_print_position,
+    _step_color_count,
+    _step_back_name,
+)
+
+
+def process_estimate_flow(event: MessageEvent, user_message: str, session_data: EstimateSession):
+    """
+    見積フロー中のやり取り
+    step 1: 属性
+    step 2: 使用日
+    step 3: 予算
+    step 4: 商品名
+    step 5: 枚数
+    step 6: プリント位置
+    step 7: 色数
+       - (前のみ/背中のみ)の場合 -> フロー完了へ
+       - (前と背中)の場合 -> step 8: 背ネーム・番号 -> step 9: 完了
+    """
+    step = session_data.step
+    if 0 < step < len(_STEP_HANDLERS):
+        _STEP_HANDLERS[step](event, user_message, session_data)
         return
 
+    # 何らかの想定外のエラー
+    delete_estimate_session(event.source.user_id)
+    line_bot_api.reply_message(event.reply_token, _FLOW_ERROR_REPLY)
+
 
 # -----------------------
 # 3) カタログ申し込みフォーム表示 (GET)
 # -----------------------
-@app.route("/catalog_form", methods=["GET"])
+# テンプレート内の変数は token だけなので、起動時に読み込んで前後に分割しておき
+# リクエスト毎の Jinja2 レンダリングを省く
+with open(os.path.join(app.root_path, "templates", "catalog_form.html"), encoding="utf-8") as fp:
+    _FORM_HEAD, _FORM_TAIL = fp.read().split("{{ token }}")
+
+
+@app.route("/catalog_form", methods=["GET"], provide_automatic_options=False)
 def show_catalog_form():
     token = str(uuid.uuid4())
     session['catalog_form_token'] = token
-    html_content = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>カタログ申込フォーム</title>
-    <style>
-        body {{ margin: 0; padding: 0; font-family: sans-serif; }}
-        .container {{ max-width: 600px; margin: 0 auto; padding: 1em; }}
-        label {{ display: block; margin-bottom: 0.5em; }}
-        input[type=text], input[type=email], textarea {{ width: 100%; padding: 0.5em; margin-top: 0.3em; box-sizing: border-box; }}
-        input[type=submit] {{ padding: 0.7em 1em; font-size: 1em; margin-top: 1em; cursor: pointer; }}
-        input[type=submit]:disabled {{ background: #ccc; cursor: not-allowed; }}
-    </style>
-    <script>
-    function preventDoubleSubmission() {{
-        const submitButton = document.getElementById('submit-btn');
-        submitButton.disabled = true;
-        submitButton.value = "送信中...";
-        return true;
-    }}
-    async function fetchAddress() {{
-        let pcRaw = document.getElementById('postal_code').value.trim();
-        pcRaw = pcRaw.replace('-', '');
-        if (pcRaw.length < 7) return;
-        try {{
-            const response = await fetch(`https://api.zipaddress.net/?zipcode=${{pcRaw}}`);
-            const data = await response.json();
-            if (data.code === 200) {{
-                document.getElementById('address_1').value = data.data.fullAddress;
-            }}
-        }} catch (error) {{ console.log("住所検索失敗:", error); }}
-    }}
-    </script>
-</head>
-<body>
-    <div class="container">
-      <h1>カタログ申込フォーム</h1>
-      <p>以下の項目をご記入の上、送信してください。</p>
-      <form action="/submit_form" method="post" onsubmit="return preventDoubleSubmission()">
-          <input type="hidden" name="form_token" value="{token}">
-          <label>氏名（必須）: <input type="text" name="name" required></label>
-          <label>郵便番号（必須）:<br><input type="text" name="postal_code" id="postal_code" onkeyup="fetchAddress()" required></label>
-          <label>都道府県・市区町村（必須）:<br><input type="text" name="address_1" id="address_1" required></label>
-          <label>番地・部屋番号など（必須）:<br><input type="text" name="address_2" id="address_2" required></label>
-          <label>電話番号（必須）: <input type="text" name="phone" required></label>
-          <label>メールアドレス（必須）: <input type="email" name="email" required></label>
-          <label>Insta・TikTok名（必須）: <input type="text" name="sns_account" required></label>
-          <label>2026年度に在籍予定の学校名・学年・クラス（未記入可）: <input type="text" name="school_info"></label>
-          <label>カタログの使用用途（例：体育祭・文化祭・部活など）: <input type="text" name="usage_purpose"></label>
-          <label>その他: <textarea name="other" rows="4"></textarea></label>
-          <input type="submit" id="submit-btn" value="送信">
-      </form>
-    </div>
-</body>
-</html>"""
-    return render_template_string(html_content)
+    return Response(_FORM_HEAD + token + _FORM_TAIL, mimetype="text/html")
 
 
 # -----------------------
 # 4) カタログ申し込みフォームの送信処理
 # -----------------------
-@app.route("/submit_form", methods=["POST"])
+# シートに書き込む前に弾く入力チェック (全角数字・全角ハイフンは NFKC で半角にしてから判定する)
+FORM_FIELD_MAX_LEN = 500
+_POSTAL_RE = re.compile(r"^\d{3}-?\d{4}$")
+_PHONE_RE = re.compile(r"^[\d\-+() ]{7,20}$")
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+# 必須項目 (catalog_form.html で required を付けている項目)
+_REQUIRED_CATALOG_FIELDS = ("name", "postal_code", "address_1", "address_2", "phone", "email", "sns_account")
+
+
+def validate_catalog_form(form_data: dict):
+    """
+    入力に問題があればエラーメッセージを返す（問題なければ None）
+    """
+    if not all(form_data[key] for key in _REQUIRED_CATALOG_FIELDS):
+        return "必須項目が入力されていません。"
+    for value in form_data.values():
+        if len(value) > FORM_FIELD_MAX_LEN:
+            return f"入力が長すぎます（各項目{FORM_FIELD_MAX_LEN}文字以内でご入力ください）。"
+    if not _POSTAL_RE.match(unicodedata.normalize("NFKC", form_data["postal_code"])):
+        return "郵便番号の形式が正しくありません。"
+    if not _PHONE_RE.match(unicodedata.normalize("NFKC", form_data["phone"])):
+        return "電話番号の形式が正しくありません。"
+    if not _EMAIL_RE.match(form_data["email"]):
+        return "メールアドレスの形式が正しくありません。"
+    return None
+
+
+# 送信ボタンの連打などで同じ内容が続けて届いた場合は、シートに触れずに受付完了を返す
+# { 入力内容のハッシュ: 受付時刻 } を古い順に保持する
+RECENT_SUBMISSION_TTL = 300
+RECENT_SUBMISSION_MAX = 4096
+_recent_submissions = OrderedDict()
+_recent_submissions_lock = threading.Lock()
+
+
+def _submission_digest(form_data: dict) -> bytes:
+    payload = "|".join(form_data[k] for k in sorted(form_data))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+
+def is_recent_submission(digest: bytes) -> bool:
+    with _recent_submissions_lock:
+        seen_at = _recent_submissions.get(digest)
+        return seen_at is not None and time.monotonic() - seen_at < RECENT_SUBMISSION_TTL
+
+
+def remember_submission(digest: bytes):
+    with _recent_submissions_lock:
+        _recent_submissions[digest] = time.monotonic()
+        _recent_submissions.move_to_end(digest)
+        if len(_recent_submissions) > RECENT_SUBMISSION_MAX:
+            _recent_submissions.popitem(last=False)
+
+
+# フォームから受け取る項目 (catalog_form.html の name 属性)
+CATALOG_FORM_FIELDS = (
+    "name",
+    "postal_code",
+    "address_1",
+    "address_2",
+    "phone",
+    "email",
+    "sns_account",
+    "school_info",
+    "usage_purpose",
+    "other",
+)
+_CATALOG_FORM_THANKS = "フォーム送信ありがとうございました！ カタログ送付をお待ちください。"
+
+
+@app.route("/submit_form", methods=["POST"], provide_automatic_options=False)
 def submit_catalog_form():
+    form = request.form
+    form_data = {key: form.get(key, "").strip() for key in CATALOG_FORM_FIELDS}
+
+    # 直前に受け付けた内容と同じなら二重送信なので、そのまま受付完了を返す
+    digest = _submission_digest(form_data)
+    if is_recent_submission(digest):
+        return _CATALOG_FORM_THANKS, 202
+
     form_token = request.form.get('form_token')
     if form_token != session.get('catalog_form_token'):
         return "二重送信、あるいは不正なリクエストです。", 400
 
+    # 入力エラーの場合はトークンを残し、ブラウザで戻って修正・再送信できるようにする
+    error_message = validate_catalog_form(form_data)
+    if error_message:
+        return error_message, 400
+
     session.pop('catalog_form_token', None)
-    form_data = {
-        "name": request.form.get("name", "").strip(),
-        "postal_code": request.form.get("postal_code", "").strip(),
-        "address_1": request.form.get("address_1", "").strip(),
-        "address_2": request.form.get("address_2", "").strip(),
-        "phone": request.form.get("phone", "").strip(),
-        "email": request.form.get("email", "").strip(),
-        "sns_account": request.form.get("sns_account", "").strip(),
-        "school_info": request.form.get("school_info", "").strip(),
-        "usage_purpose": request.form.get("usage_purpose", "").strip(),
-        "other": request.form.get("other", "").strip(),
-    }
 
     try:
         write_to_spreadsheet_for_catalog(form_data)
@@ -1248,15 +1467,28 @@ def submit_catalog_form():
     except Exception as e:
         return f"エラーが発生しました: {e}", 500
 
-    return "フォーム送信ありがとうございました！ カタログ送付をお待ちください。", 200
+    remember_submission(digest)
+    # シートへの書き込みはバックグラウンドで行うので受付完了として 202 を返す
+    return _CATALOG_FORM_THANKS, 202
 
 # -----------------------
 # 動作確認用
 # -----------------------
-@app.route("/", methods=["GET"])
+@app.route("/", methods=["GET"], provide_automatic_options=False)
 def health_check():
-    return "LINE Bot is running.", 200
+    return Response("LINE Bot is running.", 200, mimetype="text/plain")
 
 
+# 本番は gunicorn Catalog_BOT:app (gevent ワーカー, 設定は gunicorn.conf.py) で起動する。
+# 直接実行した場合は waitress があればそちらで動かし、Werkzeug のデバッグサーバーは FLASK_DEBUG=1 のときだけ使う
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5000, debug=True)
+    port = int(os.environ.get("PORT", "5000"))
+    if os.environ.get("FLASK_DEBUG") == "1":
+        app.run(host="0.0.0.0", port=port, debug=True)
+    else:
+        try:
+            from waitress import serve
+        except ImportError:
+            app.run(host="0.0.0.0", port=port)
+        else:
+            serve(app, host="0.0.0.0", port=port, threads=16)
@@ -1,626 +1,514 @@
+# 全商品・全枚数帯で共通のオプション単価 (1枚あたり)
+FULLCOLOR_ADD = 650   # フルカラー
+SET_NAME_NUM = 800    # ネーム&背番号セット
+BIG_NAME = 550        # ネーム(大)
+SMALL_NAME = 300      # ネーム(小)
+BIG_NUM = 550         # 背番号(大)
+SMALL_NUM = 300       # 背番号(小)
+
 PRICE_TABLE = [
     # ゲームシャツ
     {
         "item": "ゲームシャツ", "min_qty": 20, "max_qty": 29, "discount_type": "早割",
-        "unit_price": 1650, "color_add": 450, "pos_add": 450, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1650, "color_add": 450, "pos_add": 450
     },
     {
         "item": "ゲームシャツ", "min_qty": 20, "max_qty": 29, "discount_type": "通常",
-        "unit_price": 1850, "color_add": 450, "pos_add": 450, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1850, "color_add": 450, "pos_add": 450
     },
     {
         "item": "ゲームシャツ", "min_qty": 30, "max_qty": 39, "discount_type": "早割",
-        "unit_price": 1480, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1480, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ゲームシャツ", "min_qty": 30, "max_qty": 39, "discount_type": "通常",
-        "unit_price": 1680, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1680, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ゲームシャツ", "min_qty": 40, "max_qty": 49, "discount_type": "早割",
-        "unit_price": 1400, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1400, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ゲームシャツ", "min_qty": 40, "max_qty": 49, "discount_type": "通常",
-        "unit_price": 1600, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1600, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ゲームシャツ", "min_qty": 50, "max_qty": 99, "discount_type": "早割",
-        "unit_price": 1310, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1310, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ゲームシャツ", "min_qty": 50, "max_qty": 99, "discount_type": "通常",
-        "unit_price": 1510, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1510, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ゲームシャツ", "min_qty": 100, "max_qty": 500, "discount_type": "早割",
-        "unit_price": 1220, "color_add": 300, "pos_add": 300, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1220, "color_add": 300, "pos_add": 300
     },
     {
         "item": "ゲームシャツ", "min_qty": 100, "max_qty": 500, "discount_type": "通常",
-        "unit_price": 1420, "color_add": 300, "pos_add": 300, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1420, "color_add": 300, "pos_add": 300
     },
 
     # ストライプドライベースボールシャツ
     {
         "item": "ストライプドライベースボールシャツ", "min_qty": 20, "max_qty": 29, "discount_type": "早割",
-        "unit_price": 2200, "color_add": 450, "pos_add": 450, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2200, "color_add": 450, "pos_add": 450
     },
     {
         "item": "ストライプドライベースボールシャツ", "min_qty": 20, "max_qty": 29, "discount_type": "通常",
-        "unit_price": 2400, "color_add": 450, "pos_add": 450, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2400, "color_add": 450, "pos_add": 450
     },
     {
         "item": "ストライプドライベースボールシャツ", "min_qty": 30, "max_qty": 39, "discount_type": "早割",
-        "unit_price": 2030, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2030, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ストライプドライベースボールシャツ", "min_qty": 30, "max_qty": 39, "discount_type": "通常",
-        "unit_price": 2230, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2230, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ストライプドライベースボールシャツ", "min_qty": 40, "max_qty": 49, "discount_type": "早割",
-        "unit_price": 1950, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1950, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ストライプドライベースボールシャツ", "min_qty": 40, "max_qty": 49, "discount_type": "通常",
-        "unit_price": 2150, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2150, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ストライプドライベースボールシャツ", "min_qty": 50, "max_qty": 99, "discount_type": "早割",
-        "unit_price": 1860, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1860, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ストライプドライベースボールシャツ", "min_qty": 50, "max_qty": 99, "discount_type": "通常",
-        "unit_price": 2060, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2060, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ストライプドライベースボールシャツ", "min_qty": 100, "max_qty": 500, "discount_type": "早割",
-        "unit_price": 1770, "color_add": 300, "pos_add": 300, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1770, "color_add": 300, "pos_add": 300
     },
     {
         "item": "ストライプドライベースボールシャツ", "min_qty": 100, "max_qty": 500, "discount_type": "通常",
-        "unit_price": 1970, "color_add": 300, "pos_add": 300, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1970, "color_add": 300, "pos_add": 300
     },
 
     # ドライベースボールシャツ
     {
         "item": "ドライベースボールシャツ", "min_qty": 20, "max_qty": 29, "discount_type": "早割",
-        "unit_price": 1900, "color_add": 450, "pos_add": 450, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1900, "color_add": 450, "pos_add": 450
     },
     {
         "item": "ドライベースボールシャツ", "min_qty": 20, "max_qty": 29, "discount_type": "通常",
-        "unit_price": 2100, "color_add": 450, "pos_add": 450, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2100, "color_add": 450, "pos_add": 450
     },
     {
         "item": "ドライベースボールシャツ", "min_qty": 30, "max_qty": 39, "discount_type": "早割",
-        "unit_price": 1730, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1730, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ドライベースボールシャツ", "min_qty": 30, "max_qty": 39, "discount_type": "通常",
-        "unit_price": 1930, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1930, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ドライベースボールシャツ", "min_qty": 40, "max_qty": 49, "discount_type": "早割",
-        "unit_price": 1650, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1650, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ドライベースボールシャツ", "min_qty": 40, "max_qty": 49, "discount_type": "通常",
-        "unit_price": 1850, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1850, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ドライベースボールシャツ", "min_qty": 50, "max_qty": 99, "discount_type": "早割",
-        "unit_price": 1560, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1560, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ドライベースボールシャツ", "min_qty": 50, "max_qty": 99, "discount_type": "通常",
-        "unit_price": 1760, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1760, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ドライベースボールシャツ", "min_qty": 100, "max_qty": 500, "discount_type": "早割",
-        "unit_price": 1470, "color_add": 300, "pos_add": 300, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1470, "color_add": 300, "pos_add": 300
     },
     {
         "item": "ドライベースボールシャツ", "min_qty": 100, "max_qty": 500, "discount_type": "通常",
-        "unit_price": 1670, "color_add": 300, "pos_add": 300, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1670, "color_add": 300, "pos_add": 300
     },
 
     # ストライプユニフォーム
     {
         "item": "ストライプユニフォーム", "min_qty": 20, "max_qty": 29, "discount_type": "早割",
-        "unit_price": 2250, "color_add": 450, "pos_add": 450, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2250, "color_add": 450, "pos_add": 450
     },
     {
         "item": "ストライプユニフォーム", "min_qty": 20, "max_qty": 29, "discount_type": "通常",
-        "unit_price": 2450, "color_add": 450, "pos_add": 450, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2450, "color_add": 450, "pos_add": 450
     },
     {
         "item": "ストライプユニフォーム", "min_qty": 30, "max_qty": 39, "discount_type": "早割",
-        "unit_price": 2080, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2080, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ストライプユニフォーム", "min_qty": 30, "max_qty": 39, "discount_type": "通常",
-        "unit_price": 2280, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2280, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ストライプユニフォーム", "min_qty": 40, "max_qty": 49, "discount_type": "早割",
-        "unit_price": 2000, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2000, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ストライプユニフォーム", "min_qty": 40, "max_qty": 49, "discount_type": "通常",
-        "unit_price": 2200, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2200, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ストライプユニフォーム", "min_qty": 50, "max_qty": 99, "discount_type": "早割",
-        "unit_price": 1910, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1910, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ストライプユニフォーム", "min_qty": 50, "max_qty": 99, "discount_type": "通常",
-        "unit_price": 2110, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2110, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ストライプユニフォーム", "min_qty": 100, "max_qty": 500, "discount_type": "早割",
-        "unit_price": 1820, "color_add": 300, "pos_add": 300, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1820, "color_add": 300, "pos_add": 300
     },
     {
         "item": "ストライプユニフォーム", "min_qty": 100, "max_qty": 500, "discount_type": "通常",
-        "unit_price": 2020, "color_add": 300, "pos_add": 300, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2020, "color_add": 300, "pos_add": 300
     },
 
     # バスケシャツ
     {
         "item": "バスケシャツ", "min_qty": 20, "max_qty": 29, "discount_type": "早割",
-        "unit_price": 1730, "color_add": 450, "pos_add": 450, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1730, "color_add": 450, "pos_add": 450
     },
     {
         "item": "バスケシャツ", "min_qty": 20, "max_qty": 29, "discount_type": "通常",
-        "unit_price": 1930, "color_add": 450, "pos_add": 450, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1930, "color_add": 450, "pos_add": 450
     },
     {
         "item": "バスケシャツ", "min_qty": 30, "max_qty": 39, "discount_type": "早割",
-        "unit_price": 1560, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1560, "color_add": 350, "pos_add": 350
     },
     {
         "item": "バスケシャツ", "min_qty": 30, "max_qty": 39, "discount_type": "通常",
-        "unit_price": 1760, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1760, "color_add": 350, "pos_add": 350
     },
     {
         "item": "バスケシャツ", "min_qty": 40, "max_qty": 49, "discount_type": "早割",
-        "unit_price": 1480, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1480, "color_add": 350, "pos_add": 350
     },
     {
         "item": "バスケシャツ", "min_qty": 40, "max_qty": 49, "discount_type": "通常",
-        "unit_price": 1680, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1680, "color_add": 350, "pos_add": 350
     },
     {
         "item": "バスケシャツ", "min_qty": 50, "max_qty": 99, "discount_type": "早割",
-        "unit_price": 1390, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1390, "color_add": 350, "pos_add": 350
     },
     {
         "item": "バスケシャツ", "min_qty": 50, "max_qty": 99, "discount_type": "通常",
-        "unit_price": 1590, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1590, "color_add": 350, "pos_add": 350
     },
     {
         "item": "バスケシャツ", "min_qty": 100, "max_qty": 500, "discount_type": "早割",
-        "unit_price": 1300, "color_add": 300, "pos_add": 300, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1300, "color_add": 300, "pos_add": 300
     },
     {
         "item": "バスケシャツ", "min_qty": 100, "max_qty": 500, "discount_type": "通常",
-        "unit_price": 1500, "color_add": 300, "pos_add": 300, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1500, "color_add": 300, "pos_add": 300
     },
 
     # ドライTシャツ
     {
         "item": "ドライTシャツ", "min_qty": 20, "max_qty": 29, "discount_type": "早割",
-        "unit_price": 1240, "color_add": 450, "pos_add": 450, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1240, "color_add": 450, "pos_add": 450
     },
     {
         "item": "ドライTシャツ", "min_qty": 20, "max_qty": 29, "discount_type": "通常",
-        "unit_price": 1440, "color_add": 450, "pos_add": 450, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1440, "color_add": 450, "pos_add": 450
     },
     {
         "item": "ドライTシャツ", "min_qty": 30, "max_qty": 39, "discount_type": "早割",
-        "unit_price": 1070, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1070, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ドライTシャツ", "min_qty": 30, "max_qty": 39, "discount_type": "通常",
-        "unit_price": 1270, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1270, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ドライTシャツ", "min_qty": 40, "max_qty": 49, "discount_type": "早割",
-        "unit_price": 990, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 990, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ドライTシャツ", "min_qty": 40, "max_qty": 49, "discount_type": "通常",
-        "unit_price": 1190, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1190, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ドライTシャツ", "min_qty": 50, "max_qty": 99, "discount_type": "早割",
-        "unit_price": 900, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 900, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ドライTシャツ", "min_qty": 50, "max_qty": 99, "discount_type": "通常",
-        "unit_price": 1100, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1100, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ドライTシャツ", "min_qty": 100, "max_qty": 500, "discount_type": "早割",
-        "unit_price": 810, "color_add": 300, "pos_add": 300, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 810, "color_add": 300, "pos_add": 300
     },
     {
         "item": "ドライTシャツ", "min_qty": 100, "max_qty": 500, "discount_type": "通常",
-        "unit_price": 1010, "color_add": 300, "pos_add": 300, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1010, "color_add": 300, "pos_add": 300
     },
 
     # ハイクオリティTシャツ
     {
         "item": "ハイクオリティTシャツ", "min_qty": 20, "max_qty": 29, "discount_type": "早割",
-        "unit_price": 1450, "color_add": 450, "pos_add": 450, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1450, "color_add": 450, "pos_add": 450
     },
     {
         "item": "ハイクオリティTシャツ", "min_qty": 20, "max_qty": 29, "discount_type": "通常",
-        "unit_price": 1650, "color_add": 450, "pos_add": 450, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1650, "color_add": 450, "pos_add": 450
     },
     {
         "item": "ハイクオリティTシャツ", "min_qty": 30, "max_qty": 39, "discount_type": "早割",
-        "unit_price": 1280, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1280, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ハイクオリティTシャツ", "min_qty": 30, "max_qty": 39, "discount_type": "通常",
-        "unit_price": 1480, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1480, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ハイクオリティTシャツ", "min_qty": 40, "max_qty": 49, "discount_type": "早割",
-        "unit_price": 1200, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1200, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ハイクオリティTシャツ", "min_qty": 40, "max_qty": 49, "discount_type": "通常",
-        "unit_price": 1400, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1400, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ハイクオリティTシャツ", "min_qty": 50, "max_qty": 99, "discount_type": "早割",
-        "unit_price": 1110, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1110, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ハイクオリティTシャツ", "min_qty": 50, "max_qty": 99, "discount_type": "通常",
-        "unit_price": 1310, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1310, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ハイクオリティTシャツ", "min_qty": 100, "max_qty": 500, "discount_type": "早割",
-        "unit_price": 1020, "color_add": 300, "pos_add": 300, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1020, "color_add": 300, "pos_add": 300
     },
     {
         "item": "ハイクオリティTシャツ", "min_qty": 100, "max_qty": 500, "discount_type": "通常",
-        "unit_price": 1220, "color_add": 300, "pos_add": 300, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1220, "color_add": 300, "pos_add": 300
     },
 
     # ドライポロシャツ
     {
         "item": "ドライポロシャツ", "min_qty": 20, "max_qty": 29, "discount_type": "早割",
-        "unit_price": 1600, "color_add": 450, "pos_add": 450, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1600, "color_add": 450, "pos_add": 450
     },
     {
         "item": "ドライポロシャツ", "min_qty": 20, "max_qty": 29, "discount_type": "通常",
-        "unit_price": 1800, "color_add": 450, "pos_add": 450, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1800, "color_add": 450, "pos_add": 450
     },
     {
         "item": "ドライポロシャツ", "min_qty": 30, "max_qty": 39, "discount_type": "早割",
-        "unit_price": 1430, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1430, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ドライポロシャツ", "min_qty": 30, "max_qty": 39, "discount_type": "通常",
-        "unit_price": 1630, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1630, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ドライポロシャツ", "min_qty": 40, "max_qty": 49, "discount_type": "早割",
-        "unit_price": 1350, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1350, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ドライポロシャツ", "min_qty": 40, "max_qty": 49, "discount_type": "通常",
-        "unit_price": 1550, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1550, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ドライポロシャツ", "min_qty": 50, "max_qty": 99, "discount_type": "早割",
-        "unit_price": 1260, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1260, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ドライポロシャツ", "min_qty": 50, "max_qty": 99, "discount_type": "通常",
-        "unit_price": 1460, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1460, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ドライポロシャツ", "min_qty": 100, "max_qty": 500, "discount_type": "早割",
-        "unit_price": 1170, "color_add": 300, "pos_add": 300, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1170, "color_add": 300, "pos_add": 300
     },
     {
         "item": "ドライポロシャツ", "min_qty": 100, "max_qty": 500, "discount_type": "通常",
-        "unit_price": 1370, "color_add": 300, "pos_add": 300, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1370, "color_add": 300, "pos_add": 300
     },
 
     # ドライロングスリーブTシャツ
     {
         "item": "ドライロングスリーブTシャツ", "min_qty": 20, "max_qty": 29, "discount_type": "早割",
-        "unit_price": 1450, "color_add": 450, "pos_add": 450, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1450, "color_add": 450, "pos_add": 450
     },
     {
         "item": "ドライロングスリーブTシャツ", "min_qty": 20, "max_qty": 29, "discount_type": "通常",
-        "unit_price": 1650, "color_add": 450, "pos_add": 450, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1650, "color_add": 450, "pos_add": 450
     },
     {
         "item": "ドライロングスリーブTシャツ", "min_qty": 30, "max_qty": 39, "discount_type": "早割",
-        "unit_price": 1280, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1280, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ドライロングスリーブTシャツ", "min_qty": 30, "max_qty": 39, "discount_type": "通常",
-        "unit_price": 1480, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1480, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ドライロングスリーブTシャツ", "min_qty": 40, "max_qty": 49, "discount_type": "早割",
-        "unit_price": 1200, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1200, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ドライロングスリーブTシャツ", "min_qty": 40, "max_qty": 49, "discount_type": "通常",
-        "unit_price": 1400, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1400, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ドライロングスリーブTシャツ", "min_qty": 50, "max_qty": 99, "discount_type": "早割",
-        "unit_price": 1110, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1110, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ドライロングスリーブTシャツ", "min_qty": 50, "max_qty": 99, "discount_type": "通常",
-        "unit_price": 1310, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1310, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ドライロングスリーブTシャツ", "min_qty": 100, "max_qty": 500, "discount_type": "早割",
-        "unit_price": 1020, "color_add": 300, "pos_add": 300, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1020, "color_add": 300, "pos_add": 300
     },
     {
         "item": "ドライロングスリーブTシャツ", "min_qty": 100, "max_qty": 500, "discount_type": "通常",
-        "unit_price": 1220, "color_add": 300, "pos_add": 300, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1220, "color_add": 300, "pos_add": 300
     },
 
     # クルーネックライトトレーナー
     {
         "item": "クルーネックライトトレーナー", "min_qty": 20, "max_qty": 29, "discount_type": "早割",
-        "unit_price": 2300, "color_add": 450, "pos_add": 450, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2300, "color_add": 450, "pos_add": 450
     },
     {
         "item": "クルーネックライトトレーナー", "min_qty": 20, "max_qty": 29, "discount_type": "通常",
-        "unit_price": 2500, "color_add": 450, "pos_add": 450, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2500, "color_add": 450, "pos_add": 450
     },
     {
         "item": "クルーネックライトトレーナー", "min_qty": 30, "max_qty": 39, "discount_type": "早割",
-        "unit_price": 2130, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2130, "color_add": 350, "pos_add": 350
     },
     {
         "item": "クルーネックライトトレーナー", "min_qty": 30, "max_qty": 39, "discount_type": "通常",
-        "unit_price": 2330, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2330, "color_add": 350, "pos_add": 350
     },
     {
         "item": "クルーネックライトトレーナー", "min_qty": 40, "max_qty": 49, "discount_type": "早割",
-        "unit_price": 2050, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2050, "color_add": 350, "pos_add": 350
     },
     {
         "item": "クルーネックライトトレーナー", "min_qty": 40, "max_qty": 49, "discount_type": "通常",
-        "unit_price": 2250, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2250, "color_add": 350, "pos_add": 350
     },
     {
         "item": "クルーネックライトトレーナー", "min_qty": 50, "max_qty": 99, "discount_type": "早割",
-        "unit_price": 1960, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1960, "color_add": 350, "pos_add": 350
     },
     {
         "item": "クルーネックライトトレーナー", "min_qty": 50, "max_qty": 99, "discount_type": "通常",
-        "unit_price": 2160, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2160, "color_add": 350, "pos_add": 350
     },
     {
         "item": "クルーネックライトトレーナー", "min_qty": 100, "max_qty": 500, "discount_type": "早割",
-        "unit_price": 1870, "color_add": 300, "pos_add": 300, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 1870, "color_add": 300, "pos_add": 300
     },
     {
         "item": "クルーネックライトトレーナー", "min_qty": 100, "max_qty": 500, "discount_type": "通常",
-        "unit_price": 2070, "color_add": 300, "pos_add": 300, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2070, "color_add": 300, "pos_add": 300
     },
 
     # ジップアップライトパーカー
     {
         "item": "ジップアップライトパーカー", "min_qty": 20, "max_qty": 29, "discount_type": "早割",
-        "unit_price": 3170, "color_add": 450, "pos_add": 450, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 3170, "color_add": 450, "pos_add": 450
     },
     {
         "item": "ジップアップライトパーカー", "min_qty": 20, "max_qty": 29, "discount_type": "通常",
-        "unit_price": 3370, "color_add": 450, "pos_add": 450, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 3370, "color_add": 450, "pos_add": 450
     },
     {
         "item": "ジップアップライトパーカー", "min_qty": 30, "max_qty": 39, "discount_type": "早割",
-        "unit_price": 3000, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 3000, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ジップアップライトパーカー", "min_qty": 30, "max_qty": 39, "discount_type": "通常",
-        "unit_price": 3200, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 3200, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ジップアップライトパーカー", "min_qty": 40, "max_qty": 49, "discount_type": "早割",
-        "unit_price": 2920, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2920, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ジップアップライトパーカー", "min_qty": 40, "max_qty": 49, "discount_type": "通常",
-        "unit_price": 3120, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 3120, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ジップアップライトパーカー", "min_qty": 50, "max_qty": 99, "discount_type": "早割",
-        "unit_price": 2830, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2830, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ジップアップライトパーカー", "min_qty": 50, "max_qty": 99, "discount_type": "通常",
-        "unit_price": 3030, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 3030, "color_add": 350, "pos_add": 350
     },
     {
         "item": "ジップアップライトパーカー", "min_qty": 100, "max_qty": 500, "discount_type": "早割",
-        "unit_price": 2740, "color_add": 300, "pos_add": 300, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2740, "color_add": 300, "pos_add": 300
     },
     {
         "item": "ジップアップライトパーカー", "min_qty": 100, "max_qty": 500, "discount_type": "通常",
-        "unit_price": 2940, "color_add": 300, "pos_add": 300, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2940, "color_add": 300, "pos_add": 300
     },
 
     # フーデッドライトパーカー
     {
         "item": "フーデッドライトパーカー", "min_qty": 20, "max_qty": 29, "discount_type": "早割",
-        "unit_price": 2700, "color_add": 450, "pos_add": 450, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2700, "color_add": 450, "pos_add": 450
     },
     {
         "item": "フーデッドライトパーカー", "min_qty": 20, "max_qty": 29, "discount_type": "通常",
-        "unit_price": 2900, "color_add": 450, "pos_add": 450, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2900, "color_add": 450, "pos_add": 450
     },
     {
         "item": "フーデッドライトパーカー", "min_qty": 30, "max_qty": 39, "discount_type": "早割",
-        "unit_price": 2530, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2530, "color_add": 350, "pos_add": 350
     },
     {
         "item": "フーデッドライトパーカー", "min_qty": 30, "max_qty": 39, "discount_type": "通常",
-        "unit_price": 2730, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2730, "color_add": 350, "pos_add": 350
     },
     {
         "item": "フーデッドライトパーカー", "min_qty": 40, "max_qty": 49, "discount_type": "早割",
-        "unit_price": 2450, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2450, "color_add": 350, "pos_add": 350
     },
     {
         "item": "フーデッドライトパーカー", "min_qty": 40, "max_qty": 49, "discount_type": "通常",
-        "unit_price": 2650, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2650, "color_add": 350, "pos_add": 350
     },
     {
         "item": "フーデッドライトパーカー", "min_qty": 50, "max_qty": 99, "discount_type": "早割",
-        "unit_price": 2360, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2360, "color_add": 350, "pos_add": 350
     },
     {
         "item": "フーデッドライトパーカー", "min_qty": 50, "max_qty": 99, "discount_type": "通常",
-        "unit_price": 2560, "color_add": 350, "pos_add": 350, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2560, "color_add": 350, "pos_add": 350
     },
     {
         "item": "フーデッドライトパーカー", "min_qty": 100, "max_qty": 500, "discount_type": "早割",
-        "unit_price": 2270, "color_add": 300, "pos_add": 300, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2270, "color_add": 300, "pos_add": 300
     },
     {
         "item": "フーデッドライトパーカー", "min_qty": 100, "max_qty": 500, "discount_type": "通常",
-        "unit_price": 2470, "color_add": 300, "pos_add": 300, "fullcolor_add": 650,
-        "set_name_num": 800, "big_name": 550, "small_name": 300, "big_num": 550, "small_num": 300
+        "unit_price": 2470, "color_add": 300, "pos_add": 300
     },
 ]
 
@@ -0,0 +1,22 @@
+# gunicorn 起動設定 (gunicorn Catalog_BOT:app で自動的に読み込まれる)
+# Sheets / LINE API の待ち時間で worker が塞がらないよう gevent ワーカーで動かす
+import os
+
+# 見積フローのセッションは REDIS_URL が無いとプロセス内に保存されるので、その場合は 1 ワーカーで動かす
+REDIS_URL = os.environ.get("REDIS_URL", "")
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+workers = int(os.environ.get("WEB_CONCURRENCY", "4" if REDIS_URL else "1"))
+worker_class = "gevent"
+worker_connections = int(os.environ.get("WORKER_CONNECTIONS", "1000"))
+timeout = 60
+
+
+def on_starting(server):
+    # -w / WEB_CONCURRENCY で複数ワーカーを指定されても、REDIS_URL が無ければ起動しない
+    # (ワーカーごとにセッションが分かれ、見積フローの途中で別ワーカーに振られると続きが分からなくなる)
+    if server.cfg.workers > 1 and not REDIS_URL:
+        raise RuntimeError(
+            f"REDIS_URL が未設定のため workers={server.cfg.workers} では起動できません。"
+            "REDIS_URL を設定するか WEB_CONCURRENCY=1 にしてください。"
+        )